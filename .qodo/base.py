@@ -1,5 +1,6 @@
 # algoforge/base.py
-from typing import Callable, Any, Dict, Protocol, runtime_checkable
+from typing import Callable, Any, Dict, Optional, Protocol, runtime_checkable
+from .cache import ResultCache, _MISSING
 
 @runtime_checkable
 class Algorithm(Protocol):
@@ -21,14 +22,34 @@ class FunctionAlgorithm:
       def my_algo(data): ...
       alg = FunctionAlgorithm("my_algo", my_algo, metadata={"category":"sort"})
       register(alg)  # registry.register imported elsewhere
+    Pass cache=ResultCache(...) to memoize run() by argument content.
+    Algorithms that mutate their input (e.g. in-place heap_sort) must opt
+    out via cacheable=False or metadata={"mutates_input": True}; calls with
+    unpicklable arguments always bypass the cache.
     """
-    def __init__(self, name: str, func: Callable, metadata: Dict[str,Any]=None):
+    def __init__(self, name: str, func: Callable, metadata: Dict[str,Any]=None,
+                 cache: Optional[ResultCache]=None, cacheable: bool=True):
         self.name = name
         self.func = func
         self.metadata = metadata or {}
+        self.cache = cache
+        self.cacheable = cacheable and not self.metadata.get("mutates_input", False)
 
     def run(self, *args, **kwargs):
-        return self.func(*args, **kwargs)
+        if self.cache is None or not self.cacheable:
+            return self.func(*args, **kwargs)
+        key = self.cache.key(self.name, args, kwargs)
+        if key is None:
+            return self.func(*args, **kwargs)
+        result = self.cache.get(self.name, key)
+        if result is _MISSING:
+            result = self.func(*args, **kwargs)
+            self.cache.put(self.name, key, result)
+        return result
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters for this algorithm (empty if uncached)."""
+        return self.cache.stats(self.name) if self.cache is not None else {}
 
     def __repr__(self):
         return f"<FunctionAlgorithm name={self.name} meta={self.metadata}>"
\ No newline at end of file
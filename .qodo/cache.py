@@ -0,0 +1,161 @@
+# algoforge/cache.py
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    Content-addressed result cache shared by FunctionAlgorithm instances.
+    Keys are a blake2b digest of the pickled (name, args, kwargs); values
+    are stored pickled, so every hit returns a fresh copy and the memory
+    bound is measured in real bytes.
+    Layout:
+      - memory tier: LRU bounded by max_bytes
+      - disk tier (optional): entries evicted from memory spill to disk_dir
+    Usage:
+      cache = ResultCache(max_bytes=32 << 20, disk_dir=".algo-cache")
+      alg = FunctionAlgorithm("lcs", lcs, cache=cache)
+    """
+    def __init__(self, max_bytes: int = 64 << 20, disk_dir: Optional[str] = None):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def key(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Digest for a call, or None when the arguments cannot be pickled."""
+        try:
+            payload = pickle.dumps((name, args, sorted(kwargs.items())),
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # any __reduce__ failure or RecursionError: uncacheable
+            return None
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, name: str, key: str) -> Any:
+        """Cached value for key, or the module-level _MISSING sentinel."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters(name)["hits"] += 1
+        if entry is not None:
+            return pickle.loads(entry[1])
+
+        # disk I/O (and unpickling) happens outside the lock
+        blob = self._read_disk(key)
+        with self._lock:
+            stats = self._counters(name)
+            if blob is None:
+                stats["misses"] += 1
+                return _MISSING
+            stats["disk_hits"] += 1
+            spill = self._store(name, key, blob)
+        self._spill(spill)
+        return pickle.loads(blob)
+
+    def put(self, name: str, key: str, value: Any) -> None:
+        """Store a result; unpicklable results are silently not cached."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        with self._lock:
+            spill = self._store(name, key, blob)
+        self._spill(spill)
+
+    def stats(self, name: str = None) -> Dict[str, Any]:
+        """Per-algorithm hits/misses/evictions/disk_hits; all algorithms if name is None."""
+        with self._lock:
+            if name is not None:
+                return dict(self._counters(name))
+            return {n: dict(c) for n, c in self._stats.items()}
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the memory tier (and the disk tier when disk=True); stats are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir:
+            for fname in os.listdir(self.disk_dir):
+                if fname.endswith(".pkl"):
+                    os.remove(os.path.join(self.disk_dir, fname))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    # internal helpers (_counters/_store: callers hold self._lock)
+
+    def _counters(self, name: str) -> Dict[str, int]:
+        counters = self._stats.get(name)
+        if counters is None:
+            counters = self._stats[name] = {"hits": 0, "misses": 0, "evictions": 0, "disk_hits": 0}
+        return counters
+
+    def _store(self, name: str, key: str, blob: bytes) -> List[Tuple[str, bytes]]:
+        # returns the (key, blob) pairs to spill; the caller writes them
+        # to disk after releasing the lock
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+        if len(blob) > self.max_bytes:
+            # too large for memory at all: goes straight to disk (if any)
+            return [(key, blob)]
+        self._entries[key] = (name, blob)
+        self._bytes += len(blob)
+        spill = []
+        while self._bytes > self.max_bytes:
+            old_key, (owner, old_blob) = self._entries.popitem(last=False)
+            self._bytes -= len(old_blob)
+            self._counters(owner)["evictions"] += 1
+            spill.append((old_key, old_blob))
+        return spill
+
+    def _spill(self, entries: List[Tuple[str, bytes]]) -> None:
+        for key, blob in entries:
+            self._write_disk(key, blob)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + ".pkl")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key: str, blob: bytes) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        # write-then-rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
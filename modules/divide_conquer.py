@@ -3,19 +3,37 @@
 Implements classic divide-and-conquer algorithms:
 - Merge Sort
 - Quick Sort
-- Binary Search
-- Count Inversions
-- Closest Pair of Points
+- Binary Search (+ reusable SortedIndex with batch / Eytzinger lookups)
+- Count Inversions (merge-based, Fenwick tree, streaming)
+- Closest Pair of Points (recursive, grid hashing, NumPy strip scan)
+- K-D Tree nearest-neighbour index
+- Fork-join executor + parallel merge sort / inversions / closest pair / Strassen
 - Strassen’s Matrix Multiplication
+- Strassen on flat row-major buffers (views, peeling, BLAS leaves)
 
 Divide & Conquer strategy:
 Break → Solve → Combine → Efficient O(n log n) solutions.
 ====================================================
 """
 
+import heapq
+import os
 import random
 import math
-from typing import List, Tuple
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from multiprocessing import shared_memory
+from operator import add, mul, sub
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; flat kernels fall back to array('d')
+    np = None
 
 
 # -----------------------------------------------------------
@@ -88,6 +106,115 @@ def binary_search(arr: List[int], target: int) -> int:
     return -1
 
 
+class SortedIndex:
+    """
+    Search index built once from an array and reused for many lookups.
+    Keeps a sorted copy for lower/upper bound and range counts, an
+    Eytzinger (BFS-order) copy for branch-friendly single lookups, and a
+    NumPy copy (when available) for vectorized batch lookups.
+    """
+
+    def __init__(self, arr: Iterable[int]):
+        self._sorted = sorted(arr)
+        n = len(self._sorted)
+
+        # Eytzinger layout: slot k (1-based) has children 2k and 2k + 1;
+        # filling the slots in-order reproduces the sorted sequence
+        self._eytz = [None] * (n + 1)
+        self._eytz_rank = [0] * (n + 1)
+        stack, k, rank = [], 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._eytz[k] = self._sorted[rank]
+            self._eytz_rank[k] = rank
+            rank += 1
+            k = 2 * k + 1
+
+        self._array = None
+        if np is not None and n:
+            candidate = np.asarray(self._sorted)
+            if candidate.dtype.kind in "iuf":
+                self._array = candidate
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def lower_bound(self, x) -> int:
+        """Index of the first element >= x."""
+        return bisect_left(self._sorted, x)
+
+    def upper_bound(self, x) -> int:
+        """Index of the first element > x."""
+        return bisect_right(self._sorted, x)
+
+    def count_range(self, lo, hi) -> int:
+        """Number of elements with lo <= value <= hi."""
+        return max(0, bisect_right(self._sorted, hi) - bisect_left(self._sorted, lo))
+
+    def find(self, x) -> int:
+        """Sorted position of the first element equal to x, or -1."""
+        eytz = self._eytz
+        n = len(eytz) - 1
+        k = 1
+        while k <= n:
+            k = 2 * k + (eytz[k] < x)
+        # Undo the trailing right turns (and the final left turn that
+        # overshot) to land on the lower bound's slot
+        k >>= ((k + 1) & ~k).bit_length()
+        if k and eytz[k] == x:
+            return self._eytz_rank[k]
+        return -1
+
+    def lower_bound_batch(self, queries: Iterable[int]) -> List[int]:
+        """lower_bound for many queries at once (any iterable, including generators)."""
+        if not isinstance(queries, (list, tuple)) and not (np is not None and isinstance(queries, np.ndarray)):
+            queries = list(queries)
+        if self._array is not None:
+            return np.searchsorted(self._array, np.asarray(queries), side="left").tolist()
+
+        # Without NumPy: walk the queries in sorted order so every
+        # search starts where the previous one ended
+        result = [0] * len(queries)
+        data, lo = self._sorted, 0
+        for i in sorted(range(len(queries)), key=queries.__getitem__):
+            lo = bisect_left(data, queries[i], lo)
+            result[i] = lo
+        return result
+
+    def find_batch(self, queries: Iterable[int]) -> List[int]:
+        """find for many queries at once."""
+        queries = list(queries)
+        data, n = self._sorted, len(self._sorted)
+        return [
+            pos if pos < n and data[pos] == q else -1
+            for q, pos in zip(queries, self.lower_bound_batch(queries))
+        ]
+
+
+def benchmark_sorted_index(n: int = 1_000_000, queries: int = 100_000, seed: int = 3) -> dict:
+    """Compare lookup throughput: binary_search, bisect and SortedIndex."""
+    rng = random.Random(seed)
+    data = sorted(rng.randint(0, 10 * n) for _ in range(n))
+    probes = [rng.randint(0, 10 * n) for _ in range(queries)]
+    timings = {}
+
+    def timed(label, func):
+        start = time.perf_counter()
+        func()
+        timings[label] = time.perf_counter() - start
+
+    timed("binary_search", lambda: [binary_search(data, q) for q in probes])
+    timed("bisect", lambda: [bisect_left(data, q) for q in probes])
+    index = SortedIndex(data)
+    timed("sorted_index_find", lambda: [index.find(q) for q in probes])
+    timed("sorted_index_find_batch", lambda: index.find_batch(probes))
+
+    return timings
+
+
 # -----------------------------------------------------------
 #  COUNT INVERSIONS
 # -----------------------------------------------------------
@@ -131,21 +258,199 @@ def count_inversions(arr: List[int]) -> int:
     return left_inv + right_inv + split_inv
 
 
+def count_inversions_bit(arr: Iterable[int]) -> int:
+    """
+    Counts inversions with a coordinate-compressed Fenwick tree —
+    O(n log n), the input is never modified.
+    """
+    values = list(arr)
+    ranks = {v: r for r, v in enumerate(sorted(set(values)), 1)}
+    size = len(ranks)
+    tree = [0] * (size + 1)
+    inversions = 0
+
+    for seen, x in enumerate(values):
+        r = ranks[x]
+
+        # earlier items <= x
+        not_greater = 0
+        i = r
+        while i:
+            not_greater += tree[i]
+            i &= i - 1
+        inversions += seen - not_greater
+
+        i = r
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+
+    return inversions
+
+
+class _CountedKeys:
+    """
+    Order-statistics multiset for the streaming counter: sorted distinct
+    keys with multiplicities, split into buckets of about sqrt(distinct)
+    keys, plus a Fenwick tree over bucket totals. Keys are compressed
+    online, so any totally ordered values work and memory tracks the
+    number of distinct values, not their magnitude or the stream length.
+    """
+
+    _MIN_LOAD = 256
+
+    def __init__(self):
+        self._firsts = []   # smallest key of each bucket, for bisect
+        self._keys = []     # per-bucket sorted distinct keys
+        self._counts = []   # per-bucket multiplicities
+        self._tree = [0]    # Fenwick tree over bucket totals (1-based)
+        self.size = 0
+        self.distinct = 0
+
+    def add(self, x) -> int:
+        """Insert x; return how many stored items were greater than x."""
+        if not self._keys:
+            self._firsts.append(x)
+            self._keys.append([x])
+            self._counts.append([1])
+            self._tree.append(1)
+            self.size = self.distinct = 1
+            return 0
+
+        b = max(0, bisect_right(self._firsts, x) - 1)
+        keys, counts = self._keys[b], self._counts[b]
+        i = bisect_left(keys, x)
+        present = i < len(keys) and keys[i] == x
+
+        not_greater = sum(counts[:i]) + (counts[i] if present else 0)
+        j = b
+        tree = self._tree
+        while j:
+            not_greater += tree[j]
+            j &= j - 1
+        greater = self.size - not_greater
+
+        if present:
+            counts[i] += 1
+        else:
+            keys.insert(i, x)
+            counts.insert(i, 1)
+            self.distinct += 1
+            if i == 0:
+                self._firsts[b] = x
+        self.size += 1
+
+        j = b + 1
+        while j < len(tree):
+            tree[j] += 1
+            j += j & -j
+
+        if len(keys) > 2 * max(self._MIN_LOAD, math.isqrt(self.distinct)):
+            self._split(b)
+        return greater
+
+    def _split(self, b: int) -> None:
+        # Halve bucket b, then rebuild the Fenwick tree in O(buckets);
+        # splits happen once per ~sqrt(distinct) new keys, so this is O(1) amortized per key
+        keys, counts = self._keys[b], self._counts[b]
+        half = len(keys) // 2
+        self._keys[b:b + 1] = [keys[:half], keys[half:]]
+        self._counts[b:b + 1] = [counts[:half], counts[half:]]
+        self._firsts[b:b + 1] = [keys[0], keys[half]]
+
+        tree = [0] + [sum(c) for c in self._counts]
+        for j in range(1, len(tree)):
+            parent = j + (j & -j)
+            if parent < len(tree):
+                tree[parent] += tree[j]
+        self._tree = tree
+
+
+class InversionCounter:
+    """
+    Streaming presortedness counter: feed items one at a time and read
+    the running inversion count, ascending runs and sortedness. One pass,
+    no up-front key set — values (ints, floats, timestamps, any totally
+    ordered type) are coordinate-compressed online, O(sqrt(d)) per item
+    for d distinct values seen so far.
+    """
+
+    def __init__(self):
+        self._seen = _CountedKeys()
+        self._last = None
+        self.count = 0
+        self.inversions = 0
+        self.runs = 0
+
+    def add(self, x) -> int:
+        """Consume one item and return the running inversion count."""
+        self.inversions += self._seen.add(x)
+        if self.count == 0 or x < self._last:
+            self.runs += 1
+        self._last = x
+        self.count += 1
+        return self.inversions
+
+    def extend(self, items: Iterable) -> int:
+        """Consume every item of an iterable; returns the running count."""
+        for x in items:
+            self.add(x)
+        return self.inversions
+
+    @property
+    def distinct(self) -> int:
+        return self._seen.distinct
+
+    @property
+    def max_inversions(self) -> int:
+        return self.count * (self.count - 1) // 2
+
+    @property
+    def sortedness(self) -> float:
+        """1.0 for sorted input, 0.0 for strictly descending input."""
+        if self.count < 2:
+            return 1.0
+        return 1.0 - self.inversions / self.max_inversions
+
+    def metrics(self) -> dict:
+        return {
+            "inversions": self.inversions,
+            "max_inversions": self.max_inversions,
+            "sortedness": self.sortedness,
+            "runs": self.runs,
+        }
+
+
+def iter_inversions(items: Iterable) -> Iterator[int]:
+    """Yield the running inversion count after each item of a stream."""
+    counter = InversionCounter()
+    for x in items:
+        yield counter.add(x)
+
+
+def presortedness(arr: Iterable) -> dict:
+    """
+    Disorder metrics in one streaming pass: inversions, the maximum
+    possible, normalized sortedness and the number of ascending runs.
+    """
+    counter = InversionCounter()
+    counter.extend(arr)
+    return counter.metrics()
+
+
 # -----------------------------------------------------------
 #  CLOSEST PAIR OF POINTS (2D)
 # -----------------------------------------------------------
 
 def closest_pair(points: List[Tuple[int, int]]) -> float:
     """Smallest distance between any two points — O(n log n)."""
+    distance = math.dist
 
-    def distance(p1, p2):
-        return math.dist(p1, p2)
-
-    def brute_force(pts):
+    def brute_force(ids):
         min_dist = float("inf")
-        for i in range(len(pts)):
-            for j in range(i + 1, len(pts)):
-                min_dist = min(min_dist, distance(pts[i], pts[j]))
+        for i in range(len(ids)):
+            for j in range(i + 1, len(ids)):
+                min_dist = min(min_dist, distance(points[ids[i]], points[ids[j]]))
         return min_dist
 
     def divide(px, py):
@@ -155,20 +460,23 @@ def closest_pair(points: List[Tuple[int, int]]) -> float:
             return brute_force(px)
 
         mid = n // 2
-        mid_x = px[mid][0]
+        mid_x = points[px[mid]][0]
 
         left_x = px[:mid]
         right_x = px[mid:]
 
-        left_y = list(filter(lambda p: p[0] <= mid_x, py))
-        right_y = list(filter(lambda p: p[0] > mid_x, py))
+        # Split by index, not by x, so points sharing mid_x land on the
+        # same side as in px
+        in_left = set(left_x)
+        left_y = [i for i in py if i in in_left]
+        right_y = [i for i in py if i not in in_left]
 
         d_left = divide(left_x, left_y)
         d_right = divide(right_x, right_y)
 
         d = min(d_left, d_right)
 
-        strip = [p for p in py if abs(p[0] - mid_x) < d]
+        strip = [points[i] for i in py if abs(points[i][0] - mid_x) < d]
 
         for i in range(len(strip)):
             for j in range(i + 1, min(i + 7, len(strip))):
@@ -176,12 +484,205 @@ def closest_pair(points: List[Tuple[int, int]]) -> float:
 
         return d
 
-    px = sorted(points, key=lambda p: p[0])
-    py = sorted(points, key=lambda p: p[1])
+    px = sorted(range(len(points)), key=lambda i: points[i])
+    py = sorted(range(len(points)), key=lambda i: points[i][1])
 
     return divide(px, py)
 
 
+def closest_pair_grid(points: List[Tuple[float, float]], seed: int = None) -> float:
+    """
+    Randomized incremental closest pair with grid hashing — O(n) expected.
+    Points are inserted in random order into a grid of cell size d (the
+    best distance so far); a closer pair can only sit in the 3x3 cells
+    around the new point, and the grid is rebuilt only when d shrinks.
+    """
+    pts = list(points)
+    if len(pts) < 2:
+        return float("inf")
+
+    random.Random(seed).shuffle(pts)
+    distance = math.dist
+    floor = math.floor
+
+    def build(upto, size):
+        grid = {}
+        for p in pts[:upto]:
+            grid.setdefault((floor(p[0] / size), floor(p[1] / size)), []).append(p)
+        return grid
+
+    d = distance(pts[0], pts[1])
+    if d == 0:
+        return 0.0
+    grid = build(2, d)
+
+    for i in range(2, len(pts)):
+        p = pts[i]
+        cx, cy = floor(p[0] / d), floor(p[1] / d)
+        best = d
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for q in grid.get((gx, gy), ()):
+                    best = min(best, distance(p, q))
+
+        if best < d:
+            d = best
+            if d == 0:
+                return 0.0
+            grid = build(i + 1, d)
+        else:
+            grid.setdefault((cx, cy), []).append(p)
+
+    return d
+
+
+def closest_pair_numpy(points: List[Tuple[float, float]]) -> float:
+    """
+    Vectorized strip scan: sort along the wider axis, then compare each
+    point with its s-th successor for s = 1, 2, ... keeping only pairs
+    whose axis gap is still below the best distance. Falls back to
+    closest_pair_grid when NumPy is not installed.
+    """
+    if np is None:
+        return closest_pair_grid(points)
+
+    pts = np.asarray(points, dtype=float).reshape(-1, 2)
+    n = len(pts)
+    if n < 2:
+        return float("inf")
+
+    axis = 0 if np.ptp(pts[:, 0]) >= np.ptp(pts[:, 1]) else 1
+    pts = pts[np.argsort(pts[:, axis], kind="stable")]
+    keys = pts[:, axis]
+
+    best = math.inf
+    active = np.arange(n - 1)
+    shift = 1
+    while active.size:
+        partner = active + shift
+        gaps = pts[partner] - pts[active]
+        best = min(best, float(np.hypot(gaps[:, 0], gaps[:, 1]).min()))
+
+        # The axis gap only grows with the shift, so a dropped point is done
+        has_next = partner + 1 < n
+        active, partner = active[has_next], partner[has_next]
+        active = active[keys[partner + 1] - keys[active] < best]
+        shift += 1
+
+    return best
+
+
+class KDTree:
+    """
+    Static 2-D tree built once over a point set to answer repeated
+    nearest-neighbour queries in O(log n) expected time per query.
+    """
+
+    LEAF_SIZE = 16
+
+    def __init__(self, points: List[Tuple[float, float]]):
+        self.points = list(points)
+        self._order = list(range(len(self.points)))
+        # Parallel node arrays; axis == -1 marks a leaf covering order[lo:hi]
+        self._axis, self._split = [], []
+        self._left, self._right = [], []
+        self._lo, self._hi = [], []
+        if self.points:
+            self._build()
+
+    def _new_node(self, lo, hi):
+        for column, value in ((self._axis, -1), (self._split, 0.0), (self._left, -1),
+                              (self._right, -1), (self._lo, lo), (self._hi, hi)):
+            column.append(value)
+        return len(self._axis) - 1
+
+    def _build(self):
+        pts, order = self.points, self._order
+        stack = [self._new_node(0, len(order))]
+
+        while stack:
+            node = stack.pop()
+            lo, hi = self._lo[node], self._hi[node]
+            if hi - lo <= self.LEAF_SIZE:
+                continue
+
+            # Split the wider side of the bounding box at the median
+            xs = [pts[i][0] for i in order[lo:hi]]
+            ys = [pts[i][1] for i in order[lo:hi]]
+            axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+            order[lo:hi] = sorted(order[lo:hi], key=lambda i: pts[i][axis])
+            mid = (lo + hi) // 2
+
+            self._axis[node] = axis
+            self._split[node] = pts[order[mid]][axis]
+            self._left[node] = self._new_node(lo, mid)
+            self._right[node] = self._new_node(mid, hi)
+            stack.extend((self._left[node], self._right[node]))
+
+    def nearest(self, query: Tuple[float, float]) -> Tuple[float, Tuple[float, float]]:
+        """Return (distance, point) of the stored point closest to query."""
+        if not self.points:
+            return float("inf"), None
+
+        qx, qy = query[0], query[1]
+        pts, order = self.points, self._order
+        best_d2, best = math.inf, -1
+        stack = [(0, 0.0)]  # (node, lower bound on squared distance)
+
+        while stack:
+            node, bound = stack.pop()
+            if bound >= best_d2:
+                continue
+
+            axis = self._axis[node]
+            if axis < 0:
+                for i in order[self._lo[node]:self._hi[node]]:
+                    dx, dy = pts[i][0] - qx, pts[i][1] - qy
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2:
+                        best_d2, best = d2, i
+                continue
+
+            diff = (qx, qy)[axis] - self._split[node]
+            near, far = (self._left[node], self._right[node]) if diff < 0 else (self._right[node], self._left[node])
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))
+
+        return math.sqrt(best_d2), pts[best]
+
+    def query_batch(self, queries: List[Tuple[float, float]]) -> List[Tuple[float, Tuple[float, float]]]:
+        """Nearest neighbour for every query point."""
+        return [self.nearest(q) for q in queries]
+
+
+def benchmark_closest_pair(n: int = 1_000_000, queries: int = 10_000, seed: int = 7) -> dict:
+    """
+    Time the closest-pair variants and the k-d tree on n random points.
+    The O(n log n) recursive version is only timed up to 100k points.
+    """
+    rng = random.Random(seed)
+    points = [(rng.random() * 1e6, rng.random() * 1e6) for _ in range(n)]
+    probes = [(rng.random() * 1e6, rng.random() * 1e6) for _ in range(queries)]
+    timings = {}
+
+    def timed(label, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[label] = time.perf_counter() - start
+        return result
+
+    if n <= 100_000:
+        timed("closest_pair", closest_pair, points)
+    timed("closest_pair_grid", closest_pair_grid, points, seed)
+    if np is not None:
+        timed("closest_pair_numpy", closest_pair_numpy, points)
+
+    tree = timed("kd_tree_build", KDTree, points)
+    timed("kd_tree_queries", tree.query_batch, probes)
+
+    return timings
+
+
 # -----------------------------------------------------------
 #  STRASSEN'S MATRIX MULTIPLICATION
 # -----------------------------------------------------------
@@ -294,6 +795,539 @@ def strassen_multiply(A: List[List[float]], B: List[List[float]], cutoff: int =
     return _unpad_matrix(C_pad, rowsA, colsB)
 
 
+# -----------------------------------------------------------
+#  STRASSEN ON FLAT ROW-MAJOR BUFFERS
+# -----------------------------------------------------------
+# Matrices live in one contiguous row-major buffer each (a NumPy array, or
+# array('d') without NumPy). Quadrants are views (offset + leading
+# dimension), the seven products reuse one preallocated (S, T, P) triple
+# per recursion depth, odd dimensions are peeled off instead of padding
+# to a power of two, and blocks at or below the cutoff go to the leaf
+# kernel (BLAS matmul with NumPy).
+
+class _FlatMatrix:
+    """Row-major view into an array('d') buffer; sub-blocks share the buffer."""
+
+    __slots__ = ("buf", "off", "ld", "rows", "cols")
+
+    def __init__(self, buf, off, ld, rows, cols):
+        self.buf = buf
+        self.off = off
+        self.ld = ld
+        self.rows = rows
+        self.cols = cols
+
+    @classmethod
+    def zeros(cls, rows, cols):
+        return cls(array("d", bytes(8 * rows * cols)), 0, cols, rows, cols)
+
+    @classmethod
+    def from_rows(cls, rows):
+        cols = len(rows[0])
+        buf = array("d")
+        for row in rows:
+            buf.extend(map(float, row))
+        return cls(buf, 0, cols, len(rows), cols)
+
+    def to_rows(self):
+        return [self.buf[start:start + self.cols].tolist() for start in self._row_starts()]
+
+    def _row_starts(self):
+        return range(self.off, self.off + self.rows * self.ld, self.ld)
+
+
+class _FlatOps:
+    """Kernels over _FlatMatrix views (pure Python)."""
+
+    @staticmethod
+    def zeros(rows, cols):
+        return _FlatMatrix.zeros(rows, cols)
+
+    @staticmethod
+    def shape(m):
+        return m.rows, m.cols
+
+    @staticmethod
+    def block(m, r0, c0, rows, cols):
+        return _FlatMatrix(m.buf, m.off + r0 * m.ld + c0, m.ld, rows, cols)
+
+    @staticmethod
+    def combine(dst, a, b, op):
+        # dst = a (op) b, row by row
+        cols = dst.cols
+        for d, i, j in zip(dst._row_starts(), a._row_starts(), b._row_starts()):
+            dst.buf[d:d + cols] = array("d", map(op, a.buf[i:i + cols], b.buf[j:j + cols]))
+
+    @staticmethod
+    def accumulate(dst, src, op):
+        _FlatOps.combine(dst, dst, src, op)
+
+    @staticmethod
+    def copy(dst, src):
+        cols = dst.cols
+        for d, i in zip(dst._row_starts(), src._row_starts()):
+            dst.buf[d:d + cols] = src.buf[i:i + cols]
+
+    @staticmethod
+    def to_array(m):
+        out = array("d")
+        for start in m._row_starts():
+            out.extend(m.buf[start:start + m.cols])
+        return out
+
+    @staticmethod
+    def from_buffer(buf, rows, cols):
+        return _FlatMatrix(buf, 0, cols, rows, cols)
+
+    @staticmethod
+    def multiply(dst, a, b, accumulate=False):
+        # Leaf kernel: dot products of A rows with strided B columns
+        inner = a.cols
+        b_cols = [b.buf[b.off + j:b.off + j + (inner - 1) * b.ld + 1:b.ld] for j in range(b.cols)]
+        cols = dst.cols
+        for d, i in zip(dst._row_starts(), a._row_starts()):
+            a_row = a.buf[i:i + inner]
+            row = array("d", [sum(map(mul, a_row, col)) for col in b_cols])
+            if accumulate:
+                row = array("d", map(add, dst.buf[d:d + cols], row))
+            dst.buf[d:d + cols] = row
+
+
+class _NumpyOps:
+    """Kernels over NumPy views; the leaf is a BLAS matmul."""
+
+    @staticmethod
+    def zeros(rows, cols):
+        return np.zeros((rows, cols))
+
+    @staticmethod
+    def shape(m):
+        return m.shape
+
+    @staticmethod
+    def block(m, r0, c0, rows, cols):
+        return m[r0:r0 + rows, c0:c0 + cols]
+
+    @staticmethod
+    def combine(dst, a, b, op):
+        (np.add if op is add else np.subtract)(a, b, out=dst)
+
+    @staticmethod
+    def accumulate(dst, src, op):
+        (np.add if op is add else np.subtract)(dst, src, out=dst)
+
+    @staticmethod
+    def copy(dst, src):
+        dst[...] = src
+
+    @staticmethod
+    def to_array(m):
+        return array("d", np.ascontiguousarray(m).tobytes())
+
+    @staticmethod
+    def from_buffer(buf, rows, cols):
+        return np.frombuffer(buf, dtype=float).reshape(rows, cols)
+
+    @staticmethod
+    def multiply(dst, a, b, accumulate=False):
+        if accumulate:
+            dst += a @ b
+        else:
+            np.matmul(a, b, out=dst)
+
+
+def _strassen_workspace(ops, m, k, p, cutoff):
+    # One (S, T, P) temporary triple per recursion depth, allocated up front
+    workspace = []
+    while min(m, k, p) > cutoff:
+        m, k, p = m // 2, k // 2, p // 2
+        workspace.append((ops.zeros(m, k), ops.zeros(k, p), ops.zeros(m, p)))
+    return workspace
+
+
+# Strassen recipe. Quadrants are numbered 11, 12, 21, 22 -> 0..3; each
+# operand is (quadrant, other quadrant, op) or (quadrant, None, None), and
+# every product Mi is added to / subtracted from the listed C quadrants.
+_STRASSEN_LEFT = [(0, 3, add), (2, 3, add), (0, None, None), (3, None, None),
+                  (0, 1, add), (2, 0, sub), (1, 3, sub)]
+_STRASSEN_RIGHT = [(0, 3, add), (0, None, None), (1, 3, sub), (2, 0, sub),
+                   (3, None, None), (0, 1, add), (2, 3, add)]
+_STRASSEN_TARGETS = [((0, add), (3, add)), ((2, add), (3, sub)), ((1, add), (3, add)),
+                     ((0, add), (2, add)), ((0, sub), (1, add)), ((3, add),), ((0, add),)]
+
+
+def _quadrants(ops, M, rows, cols):
+    return [ops.block(M, 0, 0, rows, cols), ops.block(M, 0, cols, rows, cols),
+            ops.block(M, rows, 0, rows, cols), ops.block(M, rows, cols, rows, cols)]
+
+
+def _strassen_operand(ops, quads, recipe, scratch):
+    first, second, op = recipe
+    if second is None:
+        return quads[first]
+    ops.combine(scratch, quads[first], quads[second], op)
+    return scratch
+
+
+def _strassen_accumulate(ops, c_quads, index, product, filled):
+    # The first product reaching a quadrant is copied, later ones accumulate
+    for quad, op in _STRASSEN_TARGETS[index]:
+        if quad in filled:
+            ops.accumulate(c_quads[quad], product, op)
+        else:
+            ops.copy(c_quads[quad], product)
+            filled.add(quad)
+
+
+def _strassen_peel(ops, C, A, B):
+    # Fix up the odd last row / column / inner index left out of the core
+    m, k = ops.shape(A)
+    p = ops.shape(B)[1]
+    m2, p2 = m // 2 * 2, p // 2 * 2
+    blk = ops.block
+
+    if k % 2:
+        ops.multiply(blk(C, 0, 0, m2, p2), blk(A, 0, k - 1, m2, 1),
+                     blk(B, k - 1, 0, 1, p2), accumulate=True)
+    if m % 2:
+        ops.multiply(blk(C, m - 1, 0, 1, p), blk(A, m - 1, 0, 1, k), B)
+    if p % 2:
+        ops.multiply(blk(C, 0, p - 1, m2, 1), blk(A, 0, 0, m2, k), blk(B, 0, p - 1, k, 1))
+
+
+def _strassen_flat(ops, C, A, B, cutoff, workspace, depth):
+    # C = A @ B for views A (m x k), B (k x p), C (m x p)
+    m, k = ops.shape(A)
+    p = ops.shape(B)[1]
+
+    if min(m, k, p) <= cutoff:
+        ops.multiply(C, A, B)
+        return
+
+    m2, k2, p2 = m // 2, k // 2, p // 2
+    S, T, P = workspace[depth]
+    a_quads = _quadrants(ops, A, m2, k2)
+    b_quads = _quadrants(ops, B, k2, p2)
+    c_quads = _quadrants(ops, C, m2, p2)
+
+    filled = set()
+    for index in range(7):
+        left = _strassen_operand(ops, a_quads, _STRASSEN_LEFT[index], S)
+        right = _strassen_operand(ops, b_quads, _STRASSEN_RIGHT[index], T)
+        _strassen_flat(ops, P, left, right, cutoff, workspace, depth + 1)
+        _strassen_accumulate(ops, c_quads, index, P, filled)
+
+    _strassen_peel(ops, C, A, B)
+
+
+def _flat_operands(A, B):
+    # Backend plus contiguous copies of A and B and an output buffer
+    if np is not None:
+        return (_NumpyOps, np.ascontiguousarray(A, dtype=float),
+                np.ascontiguousarray(B, dtype=float), np.empty((len(A), len(B[0]))))
+    return (_FlatOps, _FlatMatrix.from_rows(A), _FlatMatrix.from_rows(B),
+            _FlatMatrix.zeros(len(A), len(B[0])))
+
+
+def strassen_multiply_flat(A: List[List[float]], B: List[List[float]], cutoff: int = 64) -> List[List[float]]:
+    """
+    Strassen multiplication on contiguous row-major buffers.
+    Same contract as strassen_multiply, but without quadrant copies,
+    per-level allocations or power-of-two padding.
+    """
+    if len(A) == 0 or len(B) == 0:
+        return []
+
+    rowsA, colsA = len(A), len(A[0])
+    rowsB, colsB = len(B), len(B[0])
+
+    if colsA != rowsB:
+        raise ValueError("Matrix dimensions incompatible for multiplication")
+
+    cutoff = max(1, cutoff)
+    ops, a, b, c = _flat_operands(A, B)
+    workspace = _strassen_workspace(ops, rowsA, colsA, colsB, cutoff)
+    _strassen_flat(ops, c, a, b, cutoff, workspace, 0)
+
+    return c.tolist() if np is not None else c.to_rows()
+
+
+# -----------------------------------------------------------
+#  FORK-JOIN PARALLEL EXECUTION
+# -----------------------------------------------------------
+_FORK_JOIN_THRESHOLD = 1 << 15
+
+
+class ForkJoinExecutor:
+    """
+    Fork-join helper over a lazily started process pool.
+
+    fork() runs a subproblem inline when its size is below `threshold`
+    (or when there is a single worker) and in the pool otherwise; join()
+    collects results in submission order. share() copies an array into
+    shared memory so workers attach to it by name instead of receiving
+    a pickled copy. Use as a context manager to release everything.
+    """
+
+    def __init__(self, workers: int = None, threshold: int = _FORK_JOIN_THRESHOLD):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.threshold = threshold
+        self._pool = None
+        self._segments = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for segment in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+    def share(self, data: array) -> Tuple[str, str, int]:
+        """Copy an array into shared memory; returns a picklable handle."""
+        nbytes = len(data) * data.itemsize
+        segment = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        segment.buf[:nbytes] = memoryview(data).cast("B")
+        self._segments[segment.name] = segment
+        return segment.name, data.typecode, len(data)
+
+    def read(self, handle: Tuple[str, str, int]) -> array:
+        """Copy a shared array back out."""
+        name, typecode, length = handle
+        out = array(typecode)
+        out.frombytes(self._segments[name].buf[:length * out.itemsize])
+        return out
+
+    def fork(self, fn: Callable, *args, size: int = None) -> Future:
+        """Schedule fn(*args); small subproblems run inline."""
+        if self.workers == 1 or (size is not None and size < self.threshold):
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool.submit(fn, *args)
+
+    @staticmethod
+    def join(futures: Iterable[Future]) -> list:
+        return [future.result() for future in futures]
+
+
+@contextmanager
+def _attached_shared(handle):
+    # Typed view over a shared array inside a worker, released on exit
+    name, typecode, length = handle
+    segment = shared_memory.SharedMemory(name=name)
+    raw = segment.buf[:length * array(typecode).itemsize]
+    view = raw.cast(typecode)
+    try:
+        yield view
+    finally:
+        view.release()
+        raw.release()
+        segment.close()
+
+
+def _chunk_bounds(n: int, parts: int) -> List[Tuple[int, int]]:
+    step = max(1, -(-n // parts))
+    return [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+
+
+def _sort_shared_slice(handle, lo, hi):
+    with _attached_shared(handle) as view:
+        view[lo:hi] = array(handle[1], merge_sort(view[lo:hi].tolist()))
+
+
+def _count_and_sort_shared_slice(handle, lo, hi) -> int:
+    # count_inversions leaves its argument sorted, which phase two relies on
+    with _attached_shared(handle) as view:
+        block = view[lo:hi].tolist()
+        inversions = count_inversions(block)
+        view[lo:hi] = array(handle[1], block)
+    return inversions
+
+
+def _count_cross_inversions(handle, left, right) -> int:
+    # Pairs (x in left block, y in right block) with x > y; both sorted
+    with _attached_shared(handle) as view:
+        xs = view[left[0]:left[1]].tolist()
+        ys = view[right[0]:right[1]].tolist()
+
+    count, i, n_left = 0, 0, len(xs)
+    for y in ys:
+        while i < n_left and xs[i] <= y:
+            i += 1
+        count += n_left - i
+    return count
+
+
+def _closest_pair_shared_slab(handle, lo, hi) -> float:
+    with _attached_shared(handle) as view:
+        slab = list(zip(view[2 * lo:2 * hi:2].tolist(), view[2 * lo + 1:2 * hi:2].tolist()))
+    return closest_pair_grid(slab)
+
+
+def _strassen_shared_product(left_handle, right_handle, out_handle, m, k, p, cutoff):
+    ops = _NumpyOps if np is not None else _FlatOps
+    with _attached_shared(left_handle) as left, _attached_shared(right_handle) as right, \
+            _attached_shared(out_handle) as out:
+        A = ops.from_buffer(left, m, k)
+        B = ops.from_buffer(right, k, p)
+        C = ops.from_buffer(out, m, p)
+        _strassen_flat(ops, C, A, B, cutoff, _strassen_workspace(ops, m, k, p, cutoff), 0)
+        del A, B, C  # drop buffer exports before the views are released
+
+
+def parallel_merge_sort(arr: List[int], workers: int = None,
+                        threshold: int = _FORK_JOIN_THRESHOLD) -> List[int]:
+    """Merge sort with one shared-memory chunk per worker, merged at the end."""
+    with ForkJoinExecutor(workers, threshold) as pool:
+        chunks = _chunk_bounds(len(arr), pool.workers)
+        handle = pool.share(array("q", arr))
+        pool.join([pool.fork(_sort_shared_slice, handle, lo, hi, size=hi - lo) for lo, hi in chunks])
+        data = pool.read(handle)
+
+    return list(heapq.merge(*(data[lo:hi] for lo, hi in chunks)))
+
+
+def parallel_count_inversions(arr: List[int], workers: int = None,
+                              threshold: int = _FORK_JOIN_THRESHOLD) -> int:
+    """
+    Inversions inside each chunk are counted (and the chunk sorted) in
+    parallel, then every pair of chunks is compared in parallel.
+    Unlike count_inversions, the input is not modified.
+    """
+    with ForkJoinExecutor(workers, threshold) as pool:
+        chunks = _chunk_bounds(len(arr), pool.workers)
+        handle = pool.share(array("q", arr))
+        within = pool.join([
+            pool.fork(_count_and_sort_shared_slice, handle, lo, hi, size=hi - lo)
+            for lo, hi in chunks
+        ])
+        across = pool.join([
+            pool.fork(_count_cross_inversions, handle, chunks[i], chunks[j],
+                      size=chunks[i][1] - chunks[i][0] + chunks[j][1] - chunks[j][0])
+            for i in range(len(chunks)) for j in range(i + 1, len(chunks))
+        ])
+
+    return sum(within) + sum(across)
+
+
+def parallel_closest_pair(points: List[Tuple[float, float]], workers: int = None,
+                          threshold: int = _FORK_JOIN_THRESHOLD) -> float:
+    """
+    Closest pair per vertical slab in parallel, then one strip check per
+    slab boundary (pairs spanning several slabs always cross a boundary
+    strip of width 2d).
+    """
+    pts = sorted(points)
+    if len(pts) < 2:
+        return float("inf")
+
+    with ForkJoinExecutor(workers, threshold) as pool:
+        chunks = _chunk_bounds(len(pts), pool.workers)
+        handle = pool.share(array("d", chain.from_iterable(pts)))
+        d = min(pool.join([
+            pool.fork(_closest_pair_shared_slab, handle, lo, hi, size=hi - lo)
+            for lo, hi in chunks if hi - lo > 1
+        ]), default=float("inf"))
+
+    xs = [p[0] for p in pts]
+    for lo, _ in chunks[1:]:
+        boundary = xs[lo]
+        strip = pts[bisect_left(xs, boundary - d):bisect_right(xs, boundary + d)]
+        if len(strip) > 1:
+            d = min(d, closest_pair_grid(strip))
+
+    return d
+
+
+def parallel_strassen_multiply(A: List[List[float]], B: List[List[float]], workers: int = None,
+                               cutoff: int = 64, threshold: int = 128) -> List[List[float]]:
+    """
+    Strassen with the seven top-level products dispatched to the pool
+    (operands and results travel through shared memory). Products whose
+    size is below `threshold` rows run inline.
+    """
+    if len(A) == 0 or len(B) == 0:
+        return []
+    if len(A[0]) != len(B):
+        raise ValueError("Matrix dimensions incompatible for multiplication")
+
+    cutoff = max(1, cutoff)
+    ops, a, b, c = _flat_operands(A, B)
+    m, k = ops.shape(a)
+    p = ops.shape(b)[1]
+    if min(m, k, p) <= cutoff:
+        return strassen_multiply_flat(A, B, cutoff)
+
+    m2, k2, p2 = m // 2, k // 2, p // 2
+    a_quads = _quadrants(ops, a, m2, k2)
+    b_quads = _quadrants(ops, b, k2, p2)
+    c_quads = _quadrants(ops, c, m2, p2)
+    S, T = ops.zeros(m2, k2), ops.zeros(k2, p2)
+
+    with ForkJoinExecutor(workers, threshold) as pool:
+        outputs, futures = [], []
+        for index in range(7):
+            left = ops.to_array(_strassen_operand(ops, a_quads, _STRASSEN_LEFT[index], S))
+            right = ops.to_array(_strassen_operand(ops, b_quads, _STRASSEN_RIGHT[index], T))
+            outputs.append(pool.share(array("d", bytes(8 * m2 * p2))))
+            futures.append(pool.fork(_strassen_shared_product, pool.share(left), pool.share(right),
+                                     outputs[-1], m2, k2, p2, cutoff, size=m2))
+        pool.join(futures)
+
+        filled = set()
+        for index, handle in enumerate(outputs):
+            _strassen_accumulate(ops, c_quads, index, ops.from_buffer(pool.read(handle), m2, p2), filled)
+
+    _strassen_peel(ops, c, a, b)
+    return c.tolist() if np is not None else c.to_rows()
+
+
+def fork_join_speedup_report(n: int = 200_000, matrix_size: int = 256,
+                             worker_counts: Sequence[int] = (1, 2, 4), seed: int = 11) -> dict:
+    """
+    Time each parallel divide-and-conquer routine per worker count.
+    Returns {algorithm: [{"workers", "time", "speedup"}, ...]}.
+    """
+    rng = random.Random(seed)
+    arr = [rng.randint(0, 100000) for _ in range(n)]
+    points = [(rng.random() * 1e6, rng.random() * 1e6) for _ in range(n)]
+    matrix = [[rng.random() for _ in range(matrix_size)] for _ in range(matrix_size)]
+
+    cases = {
+        "merge_sort": lambda w: parallel_merge_sort(arr, w, threshold=0),
+        "count_inversions": lambda w: parallel_count_inversions(arr, w, threshold=0),
+        "closest_pair": lambda w: parallel_closest_pair(points, w, threshold=0),
+        "strassen_multiply": lambda w: parallel_strassen_multiply(matrix, matrix, w, threshold=0),
+    }
+
+    report = {}
+    for name, run in cases.items():
+        rows, baseline = [], None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            run(workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            rows.append({"workers": workers, "time": elapsed, "speedup": baseline / elapsed})
+        report[name] = rows
+
+    return report
+
+
 # -----------------------------------------------------------
 #  BENCHMARK WORKLOAD
 # -----------------------------------------------------------
@@ -305,15 +1339,19 @@ def run_divide_conquer_operations(n: int = 10000):
     sorted_arr = merge_sort(arr)
     quick_sort(arr.copy())
     binary_search(sorted_arr, sorted_arr[len(sorted_arr) // 2])
+    SortedIndex(sorted_arr).find_batch(arr[:100])
     count_inversions(arr.copy())
+    count_inversions_bit(arr)
 
     points = [(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(500)]
     closest_pair(points)
+    closest_pair_grid(points)
 
     # small matrix test for Strassen
     A = [[random.randint(0, 10) for _ in range(4)] for _ in range(4)]
     B = [[random.randint(0, 10) for _ in range(4)] for _ in range(4)]
     strassen_multiply(A, B)
+    strassen_multiply_flat(A, B)
 
     return len(sorted_arr)
 
@@ -333,19 +1371,25 @@ def _manual_tests():
     # Test Binary Search
     sorted_arr = merge_sort(arr.copy())
     print("Binary Search (find 8):", binary_search(sorted_arr, 8))
+    print("SortedIndex find_batch [8, 4]:", SortedIndex(arr).find_batch([8, 4]))
 
     # Test Inversions
     arr2 = [3, 2, 1]
     print("Inversions in [3,2,1]:", count_inversions(arr2.copy()))
+    print("Inversions (Fenwick):", count_inversions_bit(arr2))
+    print("Presortedness:", presortedness(arr2))
 
     # Test Closest Pair
     points = [(0,0), (3,4), (5,1), (2,1)]
     print("Closest Pair Distance:", closest_pair(points))
+    print("Closest Pair (grid):", closest_pair_grid(points))
+    print("Nearest to (1,1):", KDTree(points).nearest((1, 1)))
 
     # Test Strassen
     A = [[1,2],[3,4]]
     B = [[5,6],[7,8]]
     print("Strassen Multiply:", strassen_multiply(A, B))
+    print("Strassen Multiply (flat):", strassen_multiply_flat(A, B))
     print("====================\n")
 
 
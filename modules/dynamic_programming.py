@@ -1,20 +1,41 @@
 """
 
 
- Fibonacci (Memoization + Tabulation)
- 0/1 Knapsack Problem
- Longest Common Subsequence (LCS)
- Coin Change Problem
- Matrix Chain Multiplication
- Subset Sum Problem
+ Fibonacci (Memoization + Tabulation + Fast Doubling with bounded cache)
+ 0/1 Knapsack Problem (full table, rolling row, item reconstruction)
+ Longest Common Subsequence (LCS) (table, bit-parallel, Hirschberg)
+ Coin Change Problem (per-call DP + reusable CoinSystem table)
+ Matrix Chain Multiplication (cost, parenthesization, O(n) approximation)
+ Subset Sum Problem (table + bitset engine)
 
 
 ==============================================================
 """
 
+from collections import OrderedDict
 from functools import lru_cache
-from typing import List
+from itertools import accumulate, repeat
+from operator import add
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import math
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the "numpy" backend needs it
+    np = None
+
+
+def _resolve_backend(backend: str) -> str:
+    """Map "python" / "numpy" / "auto" to the backend that will run."""
+    if backend == "auto":
+        return "numpy" if np is not None else "python"
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' requires NumPy to be installed")
+    return backend
 
 
 # 
@@ -43,20 +64,108 @@ def fibonacci_tabulated(n: int) -> int:
     return dp[n]
 
 
+def fibonacci_fast_doubling(n: int, mod: int = None) -> int:
+    """
+    O(log n) Fibonacci via fast doubling, no recursion:
+    F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2.
+    With mod, every step is reduced so numbers stay small.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+
+    a, b = 0, 1  # F(k), F(k+1) for k = prefix of n's bits read so far
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c %= mod
+            d %= mod
+        a, b = (d, c + d) if bit == "1" else (c, d)
+
+    return a % mod if mod else a
+
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """LRU cache with a size cap and hit / miss / eviction counters."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._data), "maxsize": self.maxsize}
+
+
+_FIB_CACHE = BoundedCache(maxsize=1024)
+
+
+def fibonacci_cached(n: int, mod: int = None) -> int:
+    """Fast-doubling Fibonacci behind a bounded LRU cache (see fibonacci_cache_stats)."""
+    key = (n, mod)
+    value = _FIB_CACHE.get(key, _MISSING)
+    if value is _MISSING:
+        value = fibonacci_fast_doubling(n, mod)
+        _FIB_CACHE.put(key, value)
+    return value
+
+
+def fibonacci_cache_stats() -> dict:
+    """Hit / miss / eviction counters of the fibonacci_cached cache."""
+    return _FIB_CACHE.stats()
+
+
+def get_fibonacci_algorithms():
+    return {
+        "fibonacci_memoized": fibonacci_memoized,
+        "fibonacci_tabulated": fibonacci_tabulated,
+        "fibonacci_fast_doubling": fibonacci_fast_doubling,
+        "fibonacci_cached": fibonacci_cached,
+    }
+
+
 # 
 #  0/1 Knapsack Problem
 # ==============================================================
 
-def knapsack(weights: List[int], values: List[int], capacity: int) -> int:
+def knapsack(weights: List[int], values: List[int], capacity: int,
+             backend: str = "python") -> int:
     """
     Classic 0/1 Knapsack — maximize profit within weight limit.
-    Uses bottom-up DP table.
+    Uses bottom-up DP table; backend="numpy" runs vectorized row updates.
     """
+    if _resolve_backend(backend) == "numpy":
+        return knapsack_rolling(weights, values, capacity, backend="numpy")
+
     n = len(values)
     dp = [[0] * (capacity + 1) for _ in range(n + 1)]
 
     for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
+        for w in range(capacity + 1):  # column 0 too: zero-weight items fit there
 
             if weights[i - 1] <= w:
                 dp[i][w] = max(
@@ -69,15 +178,93 @@ def knapsack(weights: List[int], values: List[int], capacity: int) -> int:
     return dp[n][capacity]
 
 
+def _knapsack_row(weights: List[int], values: List[int], capacity: int, backend: str):
+    """
+    Final DP row: row[c] = best value using weight <= c.
+    Only one row of O(capacity) memory is ever kept.
+    """
+    if backend == "numpy":
+        dtype = np.asarray(values).dtype if len(values) else np.dtype(np.int64)
+        row = np.zeros(capacity + 1, dtype=dtype if dtype.kind in "iuf" else float)
+        for w, v in zip(weights, values):
+            if w <= capacity:
+                candidate = row[:capacity + 1 - w] + v
+                np.maximum(row[w:], candidate, out=row[w:])
+        return row
+
+    row = [0] * (capacity + 1)
+    for w, v in zip(weights, values):
+        if w <= capacity:
+            # Same as sweeping c from capacity down to w: every candidate
+            # reads the row from before this item, so it is used at most once
+            row[w:] = list(map(max, row[w:], map(add, row[:capacity + 1 - w], repeat(v))))
+    return row
+
+
+def knapsack_rolling(weights: List[int], values: List[int], capacity: int,
+                     backend: str = "auto") -> int:
+    """
+    0/1 Knapsack with a single rolling row — O(n * capacity) time,
+    O(capacity) memory. backend: "python", "numpy" or "auto".
+    """
+    best = _knapsack_row(weights, values, capacity, _resolve_backend(backend))[capacity]
+    return best.item() if hasattr(best, "item") else best  # plain int from NumPy
+
+
+def knapsack_items(weights: List[int], values: List[int], capacity: int,
+                   backend: str = "auto") -> Tuple[int, List[int]]:
+    """
+    0/1 Knapsack returning (best_value, chosen item indices) without
+    storing the full table: the items are split in half, one rolling row
+    is computed for each half, the capacity split maximizing their sum
+    is found, and each half is solved recursively (Hirschberg-style).
+    O(n * capacity * log n) time, O(capacity) working memory.
+    """
+    backend = _resolve_backend(backend)
+    chosen = []
+
+    def solve(items, cap):
+        if not items:
+            return
+        if len(items) == 1:
+            i = items[0]
+            if weights[i] <= cap and values[i] > 0:
+                chosen.append(i)
+            return
+
+        mid = len(items) // 2
+        first, second = items[:mid], items[mid:]
+        f = _knapsack_row([weights[i] for i in first], [values[i] for i in first], cap, backend)
+        g = _knapsack_row([weights[i] for i in second], [values[i] for i in second], cap, backend)
+
+        # Best way to share the capacity between the two halves
+        if backend == "numpy":
+            split = int(np.argmax(f + g[::-1]))
+        else:
+            split = max(range(cap + 1), key=lambda c: f[c] + g[cap - c])
+        del f, g
+
+        solve(first, split)
+        solve(second, cap - split)
+
+    solve(list(range(len(values))), capacity)
+    chosen.sort()
+    return sum(values[i] for i in chosen), chosen
+
+
 # 
 #  Longest Common Subsequence (LCS)
 # ==============================================================
 
-def longest_common_subsequence(X: str, Y: str) -> int:
+def longest_common_subsequence(X: str, Y: str, backend: str = "python") -> int:
     """
     Find the length of the longest common subsequence between X and Y.
     Example: X = "AGGTAB", Y = "GXTXAYB" → 4 (GTAB)
+    backend="numpy" sweeps anti-diagonal wavefronts with int32 arrays.
     """
+    if _resolve_backend(backend) == "numpy":
+        return _lcs_numpy(X, Y)
+
     m, n = len(X), len(Y)
     dp = [[0] * (n + 1) for _ in range(m + 1)]
 
@@ -92,15 +279,129 @@ def longest_common_subsequence(X: str, Y: str) -> int:
     return dp[m][n]
 
 
+def _lcs_numpy(X: Sequence, Y: Sequence) -> int:
+    # Cells on anti-diagonal k = i + j only depend on diagonals k-1 and
+    # k-2, so each diagonal is one vectorized step. Diagonals are stored
+    # indexed by i; three buffers rotate and boundary cells stay zero.
+    m, n = len(X), len(Y)
+    if not m or not n:
+        return 0
+
+    codes = {}
+    xs = np.array([codes.setdefault(c, len(codes)) for c in X], dtype=np.int32)
+    ys = np.array([codes.setdefault(c, len(codes)) for c in Y], dtype=np.int32)
+
+    prev2 = np.zeros(m + 1, dtype=np.int32)
+    prev1 = np.zeros(m + 1, dtype=np.int32)
+    cur = np.zeros(m + 1, dtype=np.int32)
+
+    for k in range(2, m + n + 1):
+        lo, hi = max(1, k - n), min(m, k - 1)
+        match = xs[lo - 1:hi] == ys[k - hi - 1:k - lo][::-1]
+        cur[lo:hi + 1] = np.where(match, prev2[lo - 1:hi] + 1,
+                                  np.maximum(prev1[lo - 1:hi], prev1[lo:hi + 1]))
+        prev2, prev1, cur = prev1, cur, prev2
+
+    return int(prev1[m])
+
+
+def _lcs_zero_bits(A: Sequence, B: Sequence) -> int:
+    """
+    Bit-parallel LCS (Hyyrö): B is encoded one bit per position and A is
+    scanned once with big-int word operations, i.e. ~64 cells per machine
+    op. Returns a bitmask whose bit j-1 is set when LCS(A, B[:j]) grew at j,
+    so popcount of the low j bits is LCS(A, B[:j]).
+    """
+    n = len(B)
+    full = (1 << n) - 1
+
+    # Match masks for the symbols of B that also occur in A
+    wanted = set(A)
+    positions = {}
+    for j, symbol in enumerate(B):
+        if symbol in wanted:
+            positions.setdefault(symbol, []).append(j)
+    masks = {}
+    for symbol, where in positions.items():
+        bitmap = bytearray((n + 7) // 8)
+        for j in where:
+            bitmap[j >> 3] |= 1 << (j & 7)
+        masks[symbol] = int.from_bytes(bitmap, "little")
+
+    V = full
+    for symbol in A:
+        match = masks.get(symbol)
+        if match:
+            U = V & match
+            V = ((V + U) | (V - U)) & full
+
+    return ~V & full
+
+
+def lcs_length_bitparallel(X: Sequence, Y: Sequence) -> int:
+    """
+    Length of the LCS in O(m * n / w) word operations (w = 64).
+    Works on strings or any sequences of hashable items (e.g. lines).
+    """
+    if len(Y) > len(X):
+        X, Y = Y, X
+    return _lcs_zero_bits(X, Y).bit_count()
+
+
+def _lcs_prefix_row(A: Sequence, B: Sequence) -> List[int]:
+    # row[j] = LCS(A, B[:j]) for j = 0..len(B)
+    zeros = _lcs_zero_bits(A, B)
+    bits = format(zeros, f"0{len(B)}b")[::-1] if B else ""
+    return list(accumulate(map(int, bits), initial=0))
+
+
+def lcs_hirschberg(X: Sequence, Y: Sequence):
+    """
+    Hirschberg's algorithm: returns an actual longest common subsequence
+    (a str for str inputs, otherwise a list) keeping only O(min(m, n))
+    DP state. Each split computes its two score rows bit-parallel.
+    """
+    if len(Y) > len(X):
+        X, Y = Y, X
+    out = []
+
+    def solve(a, b):
+        if not a or not b:
+            return
+        if len(a) == 1:
+            if a[0] in b:
+                out.append(a[0])
+            return
+
+        mid = len(a) // 2
+        n = len(b)
+        forward = _lcs_prefix_row(a[:mid], b)               # LCS(a[:mid], b[:j])
+        backward = _lcs_prefix_row(a[mid:][::-1], b[::-1])  # LCS(a[mid:], b[n-t:])
+        split = max(range(n + 1), key=lambda j: forward[j] + backward[n - j])
+        del forward, backward
+
+        solve(a[:mid], b[:split])
+        solve(a[mid:], b[split:])
+
+    solve(X, Y)
+    return "".join(out) if isinstance(X, str) else out
+
+
 # 
 #  Coin Change Problem
 # ==============================================================
 
-def coin_change(coins: List[int], amount: int) -> int:
+def coin_change(coins: List[int], amount: int, backend: str = "python") -> int:
     """
     Find the minimum number of coins to make the given amount.
-    Returns -1 if not possible.
+    Returns -1 if not possible. backend="numpy" vectorizes each coin pass.
     """
+    if _resolve_backend(backend) == "numpy":
+        if amount < 0:
+            return -1
+        best = int(_min_coins_table(sorted(set(coins)), amount, "numpy")[amount])
+        return best if best <= amount else -1
+
     dp = [math.inf] * (amount + 1)
     dp[0] = 0
 
@@ -111,6 +412,124 @@ def coin_change(coins: List[int], amount: int) -> int:
     return dp[amount] if dp[amount] != math.inf else -1
 
 
+def _min_coins_table(coins: List[int], limit: int, backend: str):
+    """
+    table[x] = fewest coins summing to x for x in 0..limit; unreachable
+    amounts hold limit + 1 (anything above x means "impossible").
+    """
+    unreachable = limit + 1
+
+    if backend == "numpy":
+        table = np.full(limit + 1, unreachable, dtype=np.int64)
+        table[0] = 0
+        for coin in coins:
+            if coin <= 0 or coin > limit:
+                continue  # a zero coin never helps (and would divide by zero)
+            # Along each residue class mod coin, new[t] = min over u <= t of
+            # old[u] + (t - u): a running minimum of old[u] - u, plus t
+            rows = -(-(limit + 1) // coin)
+            grid = np.full(rows * coin, unreachable, dtype=np.int64)
+            grid[:limit + 1] = table
+            grid = grid.reshape(rows, coin)
+            steps = np.arange(rows, dtype=np.int64)[:, None]
+            grid = np.minimum.accumulate(grid - steps, axis=0) + steps
+            table = np.minimum(grid.reshape(-1)[:limit + 1], unreachable)
+        return table
+
+    table = [unreachable] * (limit + 1)
+    table[0] = 0
+    for coin in coins:
+        if coin <= 0:
+            continue
+        for x in range(coin, limit + 1):
+            if table[x - coin] + 1 < table[x]:
+                table[x] = table[x - coin] + 1
+    return table
+
+
+class CoinSystem:
+    """
+    Coin change for a fixed set of coins, built once and queried many
+    times: min_coins(amount) is a table lookup, the table grows (doubling)
+    when a larger amount arrives, and canonical systems — where greedy is
+    always optimal — answer amounts beyond the table greedily.
+    """
+
+    def __init__(self, coins: Iterable[int], max_amount: int = 1024, backend: str = "auto"):
+        self.coins = sorted(set(coins))
+        if any(c <= 0 for c in self.coins):
+            raise ValueError("Coin values must be positive")
+        self.backend = _resolve_backend(backend)
+
+        # Kozen–Zaks: a counterexample to greedy, if any, is below the sum
+        # of the two largest coins, so the first table covers that range
+        bound = self.coins[-1] + self.coins[-2] if len(self.coins) >= 2 else 0
+        self.max_amount = -1
+        self._build(max(max_amount, bound))
+        self.is_canonical = self._check_canonical(bound)
+
+    def _build(self, limit: int) -> None:
+        self._table = _min_coins_table(self.coins, limit, self.backend)
+        self.max_amount = limit
+
+    def _ensure(self, amount: int) -> None:
+        if amount > self.max_amount:
+            self._build(max(amount, 2 * self.max_amount))
+
+    def _greedy(self, amount: int) -> Optional[Dict[int, int]]:
+        used = {}
+        for coin in reversed(self.coins):
+            count, amount = divmod(amount, coin)
+            if count:
+                used[coin] = count
+        return used if amount == 0 else None
+
+    def _check_canonical(self, bound: int) -> bool:
+        if not self.coins or self.coins[0] != 1:
+            return False
+        return all(
+            sum(self._greedy(x).values()) == self._table[x]
+            for x in range(1, bound)
+        )
+
+    def min_coins(self, amount: int) -> int:
+        """Fewest coins summing to amount, or -1 if impossible."""
+        if amount < 0:
+            return -1
+        if amount > self.max_amount and self.is_canonical:
+            return sum(self._greedy(amount).values())
+
+        self._ensure(amount)
+        count = int(self._table[amount])
+        return count if count <= amount else -1
+
+    def query_many(self, amounts: Iterable[int]) -> List[int]:
+        """min_coins for a batch of amounts (grows the table at most once)."""
+        amounts = list(amounts)
+        if amounts and not self.is_canonical:
+            self._ensure(max(amounts))
+        return [self.min_coins(a) for a in amounts]
+
+    def make_change(self, amount: int) -> Optional[Dict[int, int]]:
+        """An optimal multiset of coins as {coin: count}, or None."""
+        if amount < 0:
+            return None
+        if self.is_canonical:
+            return self._greedy(amount)
+        if self.min_coins(amount) < 0:
+            return None
+
+        table, used = self._table, {}
+        while amount:
+            # Some coin steps down exactly one level in an optimal table
+            for coin in self.coins:
+                if coin <= amount and table[amount - coin] == table[amount] - 1:
+                    used[coin] = used.get(coin, 0) + 1
+                    amount -= coin
+                    break
+        return used
+
+
 # 
 #  Matrix Chain Multiplication
 # ==============================================================
@@ -140,13 +559,160 @@ def matrix_chain_order(p: List[int]) -> int:
     return dp[0][n - 1]
 
 
+# Parenthesization trees use the matrix's 0-based index as a leaf and a
+# (left, right) tuple for every product; format_parenthesization turns
+# them into "((A1A2)A3)". Both solvers below describe a split by polygon
+# edges: matrices i..j-1 span edge (i, j), and split[(i, j)] = k means
+# (A_i..A_{k-1}) x (A_k..A_{j-1}) — one triangle of the polygon p_0..p_n.
+
+def _parenthesization_tree(split, i, j):
+    # Iterative post-order build, safe for chains of thousands of matrices
+    built = {}
+    stack = [(i, j, False)]
+    while stack:
+        a, b, ready = stack.pop()
+        if b - a == 1:
+            built[(a, b)] = a
+            continue
+        k = split[(a, b)]
+        if ready:
+            built[(a, b)] = (built.pop((a, k)), built.pop((k, b)))
+        else:
+            stack.extend(((a, b, True), (k, b, False), (a, k, False)))
+    return built[(i, j)]
+
+
+def format_parenthesization(tree) -> str:
+    """Render a parenthesization tree as e.g. "((A1A2)A3)"."""
+    if tree is None:
+        return ""
+    out = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            out.append(node)
+        elif isinstance(node, int):
+            out.append(f"A{node + 1}")
+        else:
+            stack.extend((")", node[1], node[0], "("))
+    return "".join(out)
+
+
+def matrix_chain_parenthesization(p: List[int]) -> Tuple[int, object]:
+    """
+    Exact O(n^3) matrix chain DP that also returns the optimal
+    parenthesization tree: (min_cost, tree).
+    """
+    n = len(p) - 1
+    if n <= 0:
+        return 0, None
+
+    dp = [[0] * n for _ in range(n)]
+    split = {}
+
+    for chain_len in range(2, n + 1):
+        for i in range(n - chain_len + 1):
+            j = i + chain_len - 1
+            best, best_k = math.inf, i
+            for k in range(i, j):
+                cost = dp[i][k] + dp[k + 1][j] + p[i] * p[k + 1] * p[j + 1]
+                if cost < best:
+                    best, best_k = cost, k
+            dp[i][j] = best
+            split[(i, j + 1)] = best_k + 1
+
+    return dp[0][n - 1], _parenthesization_tree(split, 0, n)
+
+
+def matrix_chain_approx(p: List[int]) -> Tuple[int, object]:
+    """
+    O(n) approximate matrix chain ordering on the polygon view of the
+    chain (Hu–Shing / Chin style heuristic, within ~15% of optimal).
+
+    Vertices p_0..p_n form a polygon; starting from the lightest vertex
+    v_min, a stack sweep cuts off a vertex t (between b and c) whenever
+    triangle (b, t, c) beats fanning t from v_min, i.e.
+    1/w_b + 1/w_c > 1/w_t + 1/w_min; what remains is fanned from v_min.
+    Returns (cost, tree) like matrix_chain_parenthesization.
+    Dimensions must be positive.
+    """
+    n = len(p) - 1
+    if n <= 0:
+        return 0, None
+
+    lightest = min(range(n + 1), key=p.__getitem__)
+    w_min = p[lightest]
+    order = list(range(lightest, n + 1)) + list(range(lightest))
+
+    triangles = []
+    stack = order[:2]
+    for c in order[2:]:
+        w_c = p[c]
+        while len(stack) >= 2:
+            b, t = stack[-2], stack[-1]
+            w_b, w_t = p[b], p[t]
+            # 1/w_b + 1/w_c > 1/w_t + 1/w_min, cross-multiplied
+            if (w_b + w_c) * w_t * w_min > (w_t + w_min) * w_b * w_c:
+                triangles.append((b, t, c))
+                stack.pop()
+            else:
+                break
+        stack.append(c)
+
+    # Fan the remaining convex chain from the lightest vertex
+    for t, c in zip(stack[1:], stack[2:]):
+        triangles.append((lightest, t, c))
+
+    cost = 0
+    split = {}
+    for triangle in triangles:
+        a, b, c = sorted(triangle)
+        cost += p[a] * p[b] * p[c]
+        split[(a, c)] = b
+
+    return cost, _parenthesization_tree(split, 0, n)
+
+
+def benchmark_matrix_chain(sizes: Sequence[int] = (25, 50, 100, 200), seed: int = 5) -> List[dict]:
+    """
+    Exact DP vs O(n) approximation per chain length: run times and the
+    approximation's cost ratio, to locate the crossover.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for n in sizes:
+        p = [rng.randint(1, 100) for _ in range(n + 1)]
+
+        start = time.perf_counter()
+        exact_cost, _ = matrix_chain_parenthesization(p)
+        exact_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        approx_cost, _ = matrix_chain_approx(p)
+        approx_time = time.perf_counter() - start
+
+        rows.append({"matrices": n, "dp_time": exact_time, "approx_time": approx_time,
+                     "approx_ratio": approx_cost / exact_cost if exact_cost else 1.0})
+    return rows
+
+
 #  Subset Sum Problem
 # ==============================================================
 
-def subset_sum(nums: List[int], target: int) -> bool:
+def subset_sum(nums: List[int], target: int, backend: str = "python") -> bool:
     """
     Determines if there exists a subset with sum equal to target.
+    backend="numpy" keeps one boolean row and shift-ors it per item.
     """
+    if _resolve_backend(backend) == "numpy":
+        reach = np.zeros(target + 1, dtype=bool)
+        reach[0] = True
+        for x in nums:
+            if 0 < x <= target:
+                reach[x:] |= reach[:target + 1 - x].copy()
+        return bool(reach[target])
+
     n = len(nums)
     dp = [[False] * (target + 1) for _ in range(n + 1)]
 
@@ -164,6 +730,145 @@ def subset_sum(nums: List[int], target: int) -> bool:
     return dp[n][target]
 
 
+class SubsetSumBitset:
+    """
+    Every reachable subset sum of a multiset of non-negative ints, kept
+    as the bits of one big int (bit s set <=> some subset sums to s).
+    Built with one shift-or per item; afterwards any number of targets
+    are answered with a bit test. limit caps the largest sum tracked;
+    targets above sum(nums) are simply unreachable, and only targets
+    above a limit that actually cut the bitset short raise ValueError.
+    """
+
+    def __init__(self, nums: Iterable[int], limit: int = None):
+        self.nums = list(nums)
+        if any(x < 0 for x in self.nums):
+            raise ValueError("SubsetSumBitset needs non-negative numbers")
+        total = sum(self.nums)
+        self.limit = total if limit is None else limit
+        self._truncated = self.limit < total
+        self._bits = self._reachable(self.nums, self.limit)
+
+    @staticmethod
+    def _reachable(nums: List[int], limit: int) -> int:
+        mask = (1 << (limit + 1)) - 1
+        bits = 1  # the empty subset
+        for x in nums:
+            if x <= limit:
+                bits |= (bits << x) & mask
+        return bits
+
+    def can_make(self, target: int) -> bool:
+        """True if some subset sums to target."""
+        if target > self.limit:
+            if self._truncated:
+                raise ValueError(f"target {target} is above the bitset limit {self.limit}")
+            return False
+        return target >= 0 and bool((self._bits >> target) & 1)
+
+    def query_many(self, targets: Iterable[int]) -> List[bool]:
+        """can_make for a batch of targets."""
+        return [self.can_make(t) for t in targets]
+
+    def reachable_sums(self) -> List[int]:
+        """All reachable sums in increasing order."""
+        bits = format(self._bits, "b")[::-1]
+        return [s for s, bit in enumerate(bits) if bit == "1"]
+
+    def witness(self, target: int) -> Optional[List[int]]:
+        """A subset summing to target, or None if there is none."""
+        if not self.can_make(target):
+            return None
+        return self._witness(self.nums, target)
+
+    @classmethod
+    def _witness(cls, nums: List[int], target: int) -> List[int]:
+        # Divide and conquer over the items: find s reachable in the first
+        # half with target - s reachable in the second, then recurse
+        if target == 0:
+            return []
+        if len(nums) == 1:
+            return list(nums)
+
+        mid = len(nums) // 2
+        first, second = nums[:mid], nums[mid:]
+        first_bits = cls._reachable(first, target)
+        second_bits = cls._reachable(second, target)
+
+        # Bit s of mirrored is bit (target - s) of second_bits
+        mirrored = int(format(second_bits, f"0{target + 1}b")[::-1], 2)
+        both = first_bits & mirrored
+        split = (both & -both).bit_length() - 1
+
+        return cls._witness(first, split) + cls._witness(second, target - split)
+
+
+# 
+#  NumPy backend — agreement check and speedup table
+# ==============================================================
+
+def check_numpy_backend(trials: int = 200, seed: int = 0) -> bool:
+    """Compare backend="numpy" against the pure-Python DPs on random inputs."""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        n = rng.randint(0, 12)
+        weights = [rng.randint(0, 15) for _ in range(n)]
+        values = [rng.randint(0, 20) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        x = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 30)))
+        y = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 30)))
+        coins = rng.sample(range(0, 20), rng.randint(1, 4))
+        amount = rng.randint(0, 80)
+        target = rng.randint(0, 60)
+
+        for func, args in ((knapsack, (weights, values, capacity)),
+                           (longest_common_subsequence, (x, y)),
+                           (coin_change, (coins, amount)),
+                           (subset_sum, (weights, target))):
+            if func(*args, backend="python") != func(*args, backend="numpy"):
+                return False
+    return True
+
+
+def benchmark_dp_backends(sizes: Sequence[int] = (200, 1000, 3000), seed: int = 9) -> List[dict]:
+    """
+    Python vs NumPy backend per problem and input size.
+    Each row: problem, size, python_time, numpy_time, speedup, agree.
+    """
+    rng = random.Random(seed)
+    rows = []
+
+    for size in sizes:
+        weights = [rng.randint(1, 100) for _ in range(100)]
+        values = [rng.randint(1, 100) for _ in range(100)]
+        cases = {
+            "knapsack": (knapsack, (weights, values, size * 10)),
+            "lcs": (longest_common_subsequence,
+                    ("".join(rng.choice("ACGT") for _ in range(size)),
+                     "".join(rng.choice("ACGT") for _ in range(size)))),
+            "subset_sum": (subset_sum, (weights, size * 10 + 1)),
+            "coin_change": (coin_change, ([1, 3, 7, 11, 29], size * 100)),
+        }
+
+        for problem, (func, args) in cases.items():
+            timings, results = {}, {}
+            for backend in ("python", "numpy"):
+                start = time.perf_counter()
+                results[backend] = func(*args, backend=backend)
+                timings[backend] = time.perf_counter() - start
+
+            rows.append({
+                "problem": problem,
+                "size": size,
+                "python_time": timings["python"],
+                "numpy_time": timings["numpy"],
+                "speedup": timings["python"] / timings["numpy"] if timings["numpy"] else float("inf"),
+                "agree": results["python"] == results["numpy"],
+            })
+
+    return rows
+
+
 # 
 #  Test Harness (for development only)
 # ==============================================================
@@ -173,11 +878,28 @@ def run_dynamic_programming_examples():
     print("\n Running sample Dynamic Programming algorithms...\n")
 
     print("① Fibonacci:", fibonacci_tabulated(10))
+    print("   fast doubling F(10**5) mod 1e9+7:", fibonacci_fast_doubling(10**5, mod=10**9 + 7))
     print("② Knapsack:", knapsack([1, 3, 4, 5], [1, 4, 5, 7], 7))
+    print("   rolling row:", knapsack_rolling([1, 3, 4, 5], [1, 4, 5, 7], 7))
+    print("   with items:", knapsack_items([1, 3, 4, 5], [1, 4, 5, 7], 7))
     print("③ LCS:", longest_common_subsequence("AGGTAB", "GXTXAYB"))
+    print("   bit-parallel:", lcs_length_bitparallel("AGGTAB", "GXTXAYB"))
+    print("   Hirschberg:", lcs_hirschberg("AGGTAB", "GXTXAYB"))
     print("④ Coin Change:", coin_change([1, 2, 5], 11))
+    coins = CoinSystem([1, 3, 4])
+    print("   CoinSystem [1, 3, 4] amount 6:", coins.min_coins(6), coins.make_change(6),
+          "canonical:", coins.is_canonical)
     print("⑤ Matrix Chain Multiplication:", matrix_chain_order([40, 20, 30, 10, 30]))
+    cost, tree = matrix_chain_parenthesization([40, 20, 30, 10, 30])
+    print("   optimal order:", cost, format_parenthesization(tree))
+    cost, tree = matrix_chain_approx([40, 20, 30, 10, 30])
+    print("   O(n) approximation:", cost, format_parenthesization(tree))
     print("⑥ Subset Sum:", subset_sum([3, 34, 4, 12, 5, 2], 9))
+    sums = SubsetSumBitset([3, 34, 4, 12, 5, 2])
+    print("   bitset queries [9, 30, 60]:", sums.query_many([9, 30, 60]))
+    print("   witness for 9:", sums.witness(9))
+    if np is not None:
+        print("⑦ NumPy backend agrees with pure Python:", check_numpy_backend())
     print("\nAll DP algorithm tests completed.\n")
 
 
@@ -3,50 +3,51 @@
 
  Dijkstra's Algorithm  
  Kruskal's Algorithm (Union-Find)  
+ Array-backed Union-Find and incremental connectivity  
  Prim's Algorithm (Min-Heap)  
+ Filter-Kruskal and Borůvka MST (large edge sets)  
  Huffman Coding  
  Activity Selection (Interval Scheduling)  
  Fractional Knapsack  
 
 
 """
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Union
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, util
+from operator import itemgetter
 import heapq
 import random
 import math
 from collections import defaultdict, Counter
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; boruvka falls back to a pure-Python scan
+    np = None
+
+try:
+    from .graphs import CSRGraph, shortest_paths
+except ImportError:  # run as a script from inside modules/
+    from graphs import CSRGraph, shortest_paths
+
 
 # 
 #  DIJKSTRA'S ALGORITHM
 # ==============================================================
 
-def dijkstra(adj: Dict[int, List[Tuple[int, float]]], source: int) -> Dict[int, float]:
+def dijkstra(adj: Union[Dict[int, List[Tuple[int, float]]], CSRGraph], source: int
+             ) -> Union[Dict[int, float], List[float]]:
     """
-    adj: adjacency list {u: [(v, weight), ...]}
+    adj: adjacency list {u: [(v, weight), ...]} or a weighted CSRGraph
     source: starting node
-    Returns a dict of shortest distances from source.
+    Returns a dict of shortest distances from source (a list indexed by
+    node for CSRGraph input).
     Complexity: O((V + E) log V)
+    Delegates to graphs.shortest_paths.
     """
-    dist = {node: math.inf for node in adj}
-    dist[source] = 0.0
-
-    visited = set()
-    heap = [(0.0, source)]
-
-    while heap:
-        d, u = heapq.heappop(heap)
-        if u in visited:
-            continue
-        visited.add(u)
-
-        for v, w in adj.get(u, []):
-            nd = d + w
-            if nd < dist.get(v, math.inf):
-                dist[v] = nd
-                heapq.heappush(heap, (nd, v))
-
-    return dist
+    return shortest_paths(adj, source)
 
 
 # 
@@ -59,9 +60,12 @@ class UnionFind:
         self.rank = [0] * n
 
     def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        # iterative path halving: no recursion limit on long parent chains
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x: int, y: int) -> bool:
         rx = self.find(x)
@@ -80,6 +84,134 @@ class UnionFind:
         return True
 
 
+class ArrayUnionFind:
+    """
+    Compact union-find: parent and size live in array('q') (8 bytes per
+    node each, vs ~60 for two lists of ints), find uses iterative path
+    halving and union links the smaller tree under the larger.
+    Tracks the component count and supports growing by new singletons.
+    """
+
+    __slots__ = ("parent", "size", "count")
+
+    def __init__(self, n: int = 0):
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self.count = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, k: int = 1) -> int:
+        """Append k singleton nodes; returns the id of the first one."""
+        first = len(self.parent)
+        self.parent.extend(range(first, first + k))
+        self.size.extend(array("q", [1]) * k)
+        self.count += k
+        return first
+
+    def find(self, x: int) -> int:
+        if x < 0:
+            # array indexing would wrap around and alias another node
+            raise ValueError("node id must be non-negative")
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry:
+            return False
+        size = self.size
+        if size[rx] < size[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        size[rx] += size[ry]
+        self.count -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+
+def _check_node_ids(*nodes: int) -> None:
+    if min(nodes) < 0:
+        raise ValueError("node id must be non-negative")
+
+
+class IncrementalConnectivity:
+    """
+    Online connectivity over an edge stream: edges are only ever added,
+    so each one is a single union instead of a fresh BFS over the graph.
+    Node ids are ints; the structure grows automatically to cover the
+    largest id seen (unseen ids are isolated nodes).
+    """
+
+    def __init__(self, n: int = 0):
+        self.uf = ArrayUnionFind(n)
+        self.edges_seen = 0
+
+    @classmethod
+    def from_graph(cls, graph: Union[Dict[int, List], CSRGraph]) -> "IncrementalConnectivity":
+        """Seed from a CSRGraph or an adjacency dict ({u: [v, ...]} or {u: [(v, w), ...]})."""
+        if isinstance(graph, CSRGraph):
+            service = cls(graph.n)
+            service.ingest((u, v) for u in range(graph.n) for v in graph.neighbors(u))
+        else:
+            service = cls()
+            for u, nbrs in graph.items():
+                service._ensure(u)
+                service.ingest((u, v[0] if isinstance(v, tuple) else v) for v in nbrs)
+        return service
+
+    def _ensure(self, node: int) -> None:
+        if node >= len(self.uf):
+            self.uf.add(node + 1 - len(self.uf))
+
+    def add_node(self) -> int:
+        return self.uf.add()
+
+    def add_edge(self, u: int, v: int) -> bool:
+        """Record edge u-v; True if it merged two components."""
+        _check_node_ids(u, v)
+        self._ensure(max(u, v))
+        self.edges_seen += 1
+        return self.uf.union(u, v)
+
+    def ingest(self, edges: Iterable) -> int:
+        """Add (u, v) or (u, v, ...) edges from any iterable; returns the number of merges."""
+        merges = 0
+        for edge in edges:
+            merges += self.add_edge(edge[0], edge[1])
+        return merges
+
+    def connected(self, u: int, v: int) -> bool:
+        _check_node_ids(u, v)
+        n = len(self.uf)
+        if u >= n or v >= n:
+            return u == v
+        return self.uf.connected(u, v)
+
+    def component_count(self) -> int:
+        return self.uf.count
+
+    def component_size(self, u: int) -> int:
+        _check_node_ids(u)
+        return self.uf.component_size(u) if u < len(self.uf) else 1
+
+    def components(self) -> List[List[int]]:
+        """Current components as node lists (ordered by smallest member)."""
+        groups: Dict[int, List[int]] = {}
+        for node in range(len(self.uf)):
+            groups.setdefault(self.uf.find(node), []).append(node)
+        return list(groups.values())
+
+
 def kruskal(n_nodes: int, edges: List[Tuple[float, int, int]]) -> Tuple[float, List[Tuple[int, int, float]]]:
     """
     edges: list of (weight, u, v)
@@ -87,7 +219,7 @@ def kruskal(n_nodes: int, edges: List[Tuple[float, int, int]]) -> Tuple[float, L
     Complexity: O(E log E)
     """
     uf = UnionFind(n_nodes)
-    edges_sorted = sorted(edges, key=lambda x: x[0])
+    edges_sorted = sorted(edges, key=itemgetter(0))
 
     mst = []
     total_weight = 0.0
@@ -106,22 +238,48 @@ def kruskal(n_nodes: int, edges: List[Tuple[float, int, int]]) -> Tuple[float, L
 #  PRIM'S ALGORITHM (Min-Heap)
 # ==============================================================
 
-def prim(n_nodes: int, adj: Dict[int, List[Tuple[int, float]]], start: int = 0
+def prim(n_nodes: int, adj: Union[Dict[int, List[Tuple[int, float]]], CSRGraph], start: int = 0
          ) -> Tuple[float, List[Tuple[int, int, float]]]:
     """
-    adj: adjacency list
+    adj: adjacency list or an undirected weighted CSRGraph
     start: starting node
     Returns: (total_weight, mst_edges)
     Complexity: O((V + E) log V)
     """
+    edges_of = adj.edges if isinstance(adj, CSRGraph) else lambda u: adj.get(u, [])
+    mst = []
+    total_weight = _prim_grow(n_nodes, start, edges_of, [False] * n_nodes, mst)
+    return total_weight, mst
+
+
+def prim_edges(n_nodes: int, edges: List[Tuple[float, int, int]]) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    Prim on a kruskal-style (weight, u, v) edge list, so it can be swapped
+    with the other MST solvers. Grows from every unvisited node, so a
+    disconnected graph yields a spanning forest as kruskal does.
+    """
+    adj = defaultdict(list)
+    for w, u, v in edges:
+        adj[u].append((v, w))
+        adj[v].append((u, w))
+    edges_of = lambda u: adj.get(u, [])
     visited = [False] * n_nodes
+    mst = []
+    total_weight = 0.0
+    for start in range(n_nodes):
+        if not visited[start]:
+            total_weight += _prim_grow(n_nodes, start, edges_of, visited, mst)
+    return total_weight, mst
+
+
+def _prim_grow(n_nodes: int, start: int, edges_of, visited: List[bool], mst: list) -> float:
+    # grow one tree from start, appending its edges to mst; returns its weight
     visited[start] = True
 
     heap = []
-    for v, w in adj.get(start, []):
+    for v, w in edges_of(start):
         heapq.heappush(heap, (w, start, v))
 
-    mst = []
     total_weight = 0.0
 
     while heap and len(mst) < n_nodes - 1:
@@ -133,13 +291,314 @@ def prim(n_nodes: int, adj: Dict[int, List[Tuple[int, float]]], start: int = 0
         mst.append((u, v, w))
         total_weight += w
 
-        for to, wt in adj.get(v, []):
+        for to, wt in edges_of(v):
             if not visited[to]:
                 heapq.heappush(heap, (wt, v, to))
 
+    return total_weight
+
+
+# 
+#  FILTER-KRUSKAL AND BORŮVKA (large edge sets)
+# ==============================================================
+
+_FILTER_KRUSKAL_THRESHOLD = 16384
+_BORUVKA_MIN_PARALLEL_EDGES = 200_000
+
+# per worker process: attached edge/label segments and their NumPy views
+_BORUVKA_STATE: Dict[str, Any] = {}
+
+
+def _mst_edge_list(edges: Union[List[Tuple[float, int, int]], CSRGraph]) -> List[Tuple[float, int, int]]:
+    # kruskal's (weight, u, v) format; an undirected CSRGraph stores each
+    # edge twice, so only the u < v copy is kept (self-loops never matter)
+    if not isinstance(edges, CSRGraph):
+        return edges
+    return [(w, u, v) for u in range(edges.n) for v, w in edges.edges(u) if u < v]
+
+
+def filter_kruskal(n_nodes: int, edges: Union[List[Tuple[float, int, int]], CSRGraph],
+                   threshold: int = _FILTER_KRUSKAL_THRESHOLD, seed: int = 0
+                   ) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    Kruskal without sorting the whole edge list up front: partition around
+    a random pivot weight, solve the light side first, then drop heavy
+    edges whose endpoints are already connected before touching them.
+    Parts at or below threshold are sorted and scanned like kruskal.
+    edges: list of (weight, u, v) or an undirected weighted CSRGraph
+    Returns: (total_weight, mst_edges) — the same total as kruskal.
+    Expected O(E + V log V log(E/V)) on random weights.
+    """
+    rng = random.Random(seed)
+    uf = ArrayUnionFind(n_nodes)
+    mst = []
+    total_weight = 0.0
+    target = n_nodes - 1
+    weight_of = itemgetter(0)
+
+    # stack of (edges, needs_filter, single_weight); light parts are pushed
+    # last so they run first
+    stack = [(_mst_edge_list(edges), False, False)]
+    while stack and len(mst) < target:
+        part, needs_filter, single_weight = stack.pop()
+        if needs_filter:
+            find = uf.find
+            part = [e for e in part if find(e[1]) != find(e[2])]
+
+        if single_weight or len(part) <= threshold:
+            for w, u, v in sorted(part, key=weight_of):
+                if uf.union(u, v):
+                    mst.append((u, v, w))
+                    total_weight += w
+                    if len(mst) == target:
+                        break
+            continue
+
+        pivot = part[rng.randrange(len(part))][0]
+        light, equal, heavy = [], [], []
+        for e in part:
+            w = e[0]
+            if w < pivot:
+                light.append(e)
+            elif w > pivot:
+                heavy.append(e)
+            else:
+                equal.append(e)
+        # equal-weight edges are never partitioned again: one in-order scan
+        stack.append((heavy, True, False))
+        stack.append((equal, True, True))
+        stack.append((light, False, False))
+
+    return total_weight, mst
+
+
+def _boruvka_arrays(n_nodes: int, edges):
+    # (u, v, w) NumPy arrays sorted by (weight, input index): a strict total
+    # order on edges, so each round's cheapest-edge choices never form a cycle
+    if isinstance(edges, CSRGraph):
+        offsets, targets, weights = edges.to_numpy()
+        src = np.repeat(np.arange(n_nodes, dtype=np.int64), np.diff(offsets))
+        keep = src < targets
+        u, v = src[keep], targets[keep].astype(np.int64)
+        w = weights[keep] if weights is not None else np.ones(len(u))
+    else:
+        table = np.array(edges, dtype=np.float64).reshape(-1, 3)
+        w, u, v = table[:, 0], table[:, 1].astype(np.int64), table[:, 2].astype(np.int64)
+    order = np.argsort(w, kind="stable")
+    return u[order], v[order], w[order]
+
+
+def _cheapest_positions(ru, rv, n_nodes: int, lo: int = 0):
+    # (component, position) of the first — hence cheapest — crossing edge
+    # for every component touching one; ru/rv are the endpoint labels of
+    # sorted edges starting at position lo
+    pos = np.flatnonzero(ru != rv)
+    best = np.full(n_nodes, np.iinfo(np.int64).max)
+    np.minimum.at(best, ru[pos], pos)
+    np.minimum.at(best, rv[pos], pos)
+    ends = np.flatnonzero(best != np.iinfo(np.int64).max)
+    return ends, best[ends] + lo
+
+
+def _release_segments(segments, unlink: bool) -> None:
+    # close every segment, and unlink when we own them, even if a close
+    # fails because some view (e.g. one held by a traceback) still exports
+    # the buffer; the mapping then goes away when that view is collected
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+        finally:
+            if unlink:
+                segment.unlink()
+
+
+def _boruvka_worker_release() -> None:
+    # views first: a segment cannot be closed while NumPy still exports it
+    _BORUVKA_STATE.pop("views", None)
+    _release_segments(_BORUVKA_STATE.pop("segments", []), unlink=False)
+
+
+def _boruvka_worker_init(spec) -> None:
+    segments, views = [], []
+    _BORUVKA_STATE["segments"] = segments
+    _BORUVKA_STATE["views"] = views
+    try:
+        for name, dtype, length in spec:
+            segment = shared_memory.SharedMemory(name=name)
+            segments.append(segment)
+            views.append(np.ndarray((length,), dtype=dtype, buffer=segment.buf))
+    except BaseException:
+        del views[:]
+        _boruvka_worker_release()
+        raise
+    # pool workers leave through os._exit, so atexit never runs; multiprocessing
+    # finalizers with an exit priority do
+    util.Finalize(None, _boruvka_worker_release, exitpriority=10)
+
+
+def _boruvka_worker_scan(bounds):
+    u, v, comp = _BORUVKA_STATE["views"]
+    lo, hi = bounds
+    return _cheapest_positions(comp[u[lo:hi]], comp[v[lo:hi]], len(comp), lo)
+
+
+def boruvka(n_nodes: int, edges: Union[List[Tuple[float, int, int]], CSRGraph],
+            workers: Optional[int] = None) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    Borůvka MST: each round every component picks its cheapest outgoing
+    edge (ties broken by input position) and all picks merge at once;
+    components at least halve per round, so O(E log V) total work.
+    With NumPy the per-round scan is vectorized over the edge arrays and
+    component labels are merged by pointer jumping. workers > 1 splits
+    the scan across processes that attach the edge and label arrays in
+    shared memory. Without NumPy a pure-Python scan is used.
+    edges: list of (weight, u, v) or an undirected weighted CSRGraph
+    Returns: (total_weight, mst_edges) — a minimum spanning forest.
+    """
+    if np is None:
+        return _boruvka_python(n_nodes, _mst_edge_list(edges))
+
+    u, v, w = _boruvka_arrays(n_nodes, edges)
+    m = len(u)
+    workers = max(1, workers or 1)
+    if workers > 1 and m >= _BORUVKA_MIN_PARALLEL_EDGES:
+        chosen = _boruvka_parallel(n_nodes, u, v, workers)
+    else:
+        live = [u, v, np.arange(m)]
+
+        def scan(comp):
+            # drop edges that became internal so later rounds scan less
+            lu, lv, index = live
+            ru, rv = comp[lu], comp[lv]
+            crossing = ru != rv
+            if not crossing.all():
+                live[:] = lu[crossing], lv[crossing], index[crossing]
+                ru, rv = ru[crossing], rv[crossing]
+            ends, pos = _cheapest_positions(ru, rv, n_nodes)
+            return ends, live[2][pos]
+
+        chosen = _boruvka_rounds(n_nodes, np.arange(n_nodes, dtype=np.int64), scan, u, v)
+
+    return float(w[chosen].sum()), list(zip(u[chosen].tolist(), v[chosen].tolist(), w[chosen].tolist()))
+
+
+def _boruvka_rounds(n_nodes: int, comp, scan, u, v):
+    # comp is updated in place (it may live in shared memory); returns the
+    # sorted positions of all picked edges
+    picked = []
+    while True:
+        ends, pos = scan(comp)
+        if not len(ends):
+            break
+
+        # each component points at the component across its cheapest edge;
+        # a mutual pair picked the same edge and its smaller label is the root
+        cu, cv = comp[u[pos]], comp[v[pos]]
+        other = np.where(cu == ends, cv, cu)
+        parent = np.arange(n_nodes, dtype=np.int64)
+        parent[ends] = other
+        mutual = (parent[other] == ends) & (ends < other)
+        parent[ends[mutual]] = ends[mutual]
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+        comp[:] = parent[comp]
+        picked.append(np.unique(pos))
+
+    return np.concatenate(picked) if picked else np.empty(0, dtype=np.int64)
+
+
+def _boruvka_parallel(n_nodes: int, u, v, workers: int):
+    m = len(u)
+    segments, spec = [], []
+    comp = None
+    try:
+        for arr in (u, v, np.arange(n_nodes, dtype=np.int64)):
+            segment = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+            segments.append(segment)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=segment.buf)[:] = arr
+            spec.append((segment.name, arr.dtype.str, len(arr)))
+
+        step = -(-m // workers)
+        chunks = [(lo, min(lo + step, m)) for lo in range(0, m, step)]
+        comp = np.ndarray((n_nodes,), dtype=np.int64, buffer=segments[2].buf)
+
+        def scan(_):
+            best = np.full(n_nodes, m)
+            for ends, pos in pool.map(_boruvka_worker_scan, chunks):
+                np.minimum.at(best, ends, pos)
+            ends = np.flatnonzero(best < m)
+            return ends, best[ends]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_boruvka_worker_init,
+                                 initargs=(spec,)) as pool:
+            chosen = _boruvka_rounds(n_nodes, comp, scan, u, v)
+    finally:
+        comp = None  # release the buffer export before closing the segment
+        _release_segments(segments, unlink=True)
+    return chosen
+
+
+def _boruvka_python(n_nodes: int, edges: List[Tuple[float, int, int]]) -> Tuple[float, List[Tuple[int, int, float]]]:
+    uf = ArrayUnionFind(n_nodes)
+    mst = []
+    total_weight = 0.0
+    keyed = sorted(range(len(edges)), key=lambda i: edges[i][0])  # (weight, index) order
+
+    while True:
+        cheapest: Dict[int, int] = {}
+        for rank, i in enumerate(keyed):
+            _, u, v = edges[i]
+            ru, rv = uf.find(u), uf.find(v)
+            if ru == rv:
+                continue
+            # keyed is ascending, so the first edge seen per component is cheapest
+            cheapest.setdefault(ru, rank)
+            cheapest.setdefault(rv, rank)
+        if not cheapest:
+            break
+        for rank in sorted(set(cheapest.values())):
+            w, u, v = edges[keyed[rank]]
+            if uf.union(u, v):
+                mst.append((u, v, w))
+                total_weight += w
+        keyed = [i for i in keyed if uf.find(edges[i][1]) != uf.find(edges[i][2])]
+
     return total_weight, mst
 
 
+def get_mst_algorithms():
+    """MST solvers by name; each takes (n_nodes, edges, ...) and returns (total_weight, mst_edges)."""
+    return {
+        "kruskal": kruskal,
+        "filter_kruskal": filter_kruskal,
+        "boruvka": boruvka,
+        "prim": prim_edges,
+    }
+
+
+def benchmark_mst(n_nodes: int = 2000, n_edges: int = 600_000, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Time the edge-list MST solvers on a random graph. Filter-Kruskal pays
+    off on dense graphs (many heavy edges filtered unsorted); Borůvka's
+    vectorized rounds need NumPy.
+    """
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.random(), rng.randrange(n_nodes), rng.randrange(n_nodes)) for _ in range(n_edges)]
+    rows = []
+    for name, solve in get_mst_algorithms().items():
+        start = time.perf_counter()
+        total, _ = solve(n_nodes, edges)
+        rows.append({"algorithm": name, "seconds": time.perf_counter() - start, "total_weight": total})
+    return rows
+
+
 # 
 #  HUFFMAN CODING
 # ==============================================================
@@ -284,8 +743,16 @@ def run_greedy_operations(seed: int = 42) -> Dict[str, Any]:
 
     kruskal_weight, _ = kruskal(n, edges)
     prim_weight, _ = prim(n, adj, 0)
+    csr = CSRGraph.from_adjacency(adj)
+    stream = IncrementalConnectivity()
+    stream.ingest((u, v) for _, u, v in edges)
+    results["stream_components"] = stream.component_count()
+    results["csr_matches_dict"] = (dijkstra(csr, 0) == [dist.get(i, math.inf) for i in range(n)]
+                                   and prim(n, csr, 0)[0] == prim_weight)
 
     results["kruskal_weight"] = kruskal_weight
+    results["filter_kruskal_weight"], _ = filter_kruskal(n, edges, threshold=16)
+    results["boruvka_weight"], _ = boruvka(n, edges)
     results["prim_weight"] = prim_weight
 
     # ---- HUFFMAN ----
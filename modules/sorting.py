@@ -2,14 +2,38 @@
 Complete Sorting Algorithms Module for AlgoForge.
 Includes:
 - Merge Sort
+- Adaptive Merge Sort (natural runs + galloping)
 - Quick Sort
+- Intro Sort (in-place introspective quicksort)
 - Heap Sort
+- Top-K / Partial Sort / K-Way Merge
 - Insertion Sort
 - Selection Sort
 - Bubble Sort
+- Counting Sort / LSD Radix Sort (integer keys, NumPy-vectorized when available)
+- External Merge Sort (binary integer files larger than RAM)
+- Parallel Sample Sort (process pool over shared memory)
 """
 
-from typing import List
+import heapq
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain, islice, repeat
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; integer sorts fall back to pure Python
+    np = None
 
 
 # -----------------------------------------------------
@@ -39,6 +63,185 @@ def _merge(left, right):
     return result
 
 
+# -----------------------------------------------------
+# ADAPTIVE MERGE SORT (bottom-up, natural runs)
+# -----------------------------------------------------
+_MIN_MERGE = 32
+_MIN_GALLOP = 7
+
+
+def adaptive_merge_sort(arr: List[int]) -> List[int]:
+    """
+    Bottom-up merge sort over the natural runs already present in arr.
+    Short runs are extended with binary insertion sort, merges gallop
+    through long one-sided streaks and a single scratch buffer of
+    n // 2 + 1 slots is reused by every merge. Returns a new list.
+    """
+    data = list(arr)
+    n = len(data)
+    if n < 2:
+        return data
+
+    # Split into runs of at least `min_run` elements
+    min_run = _min_run_length(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        run_len = _count_run(data, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(data, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append(lo)
+        lo += run_len
+    runs.append(n)
+
+    # Merge neighbouring runs pass by pass until one run is left
+    scratch = [None] * (n // 2 + 1)
+    while len(runs) > 2:
+        merged = [0]
+        for k in range(0, len(runs) - 2, 2):
+            _merge_runs(data, runs[k], runs[k + 1], runs[k + 2], scratch)
+            merged.append(runs[k + 2])
+        if len(runs) % 2 == 0:
+            # odd number of runs: the last one is carried over unchanged
+            merged.append(runs[-1])
+        runs = merged
+
+    return data
+
+
+def _min_run_length(n: int) -> int:
+    # Same rule as CPython's timsort: keeps the run count a power of two
+    r = 0
+    while n >= _MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(data, lo, n):
+    # Length of the run starting at lo; strictly descending runs are reversed
+    hi = lo + 1
+    if hi == n:
+        return 1
+
+    if data[hi] < data[lo]:
+        while hi + 1 < n and data[hi + 1] < data[hi]:
+            hi += 1
+        hi += 1
+        data[lo:hi] = data[lo:hi][::-1]
+    else:
+        while hi + 1 < n and not data[hi + 1] < data[hi]:
+            hi += 1
+        hi += 1
+
+    return hi - lo
+
+
+def _binary_insertion_sort(data, lo, hi, start):
+    # data[lo:start] is already sorted; insert data[start:hi] one by one
+    for i in range(start, hi):
+        pivot = data[i]
+        pos = bisect_right(data, pivot, lo, i)
+        data[pos + 1:i + 1] = data[pos:i]
+        data[pos] = pivot
+
+
+def _merge_runs(data, lo, mid, hi, scratch):
+    # Elements of the left run already <= the right run's head stay put,
+    # and so do right-run elements >= the left run's tail
+    lo = bisect_right(data, data[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(data, data[mid - 1], mid, hi)
+
+    if mid - lo <= hi - mid:
+        _merge_lo(data, lo, mid, hi, scratch)
+    else:
+        _merge_hi(data, lo, mid, hi, scratch)
+
+
+def _merge_lo(data, lo, mid, hi, tmp):
+    # Left run is the shorter one: copy it out and merge front to back
+    len_left = mid - lo
+    tmp[:len_left] = data[lo:mid]
+    i, j, k = 0, mid, lo
+    wins_left = wins_right = 0
+
+    while i < len_left and j < hi:
+        if data[j] < tmp[i]:
+            data[k] = data[j]
+            j += 1
+            k += 1
+            wins_right += 1
+            wins_left = 0
+            if wins_right >= _MIN_GALLOP:
+                end = bisect_left(data, tmp[i], j, hi)
+                count = end - j
+                data[k:k + count] = data[j:end]
+                k += count
+                j = end
+                wins_right = 0
+        else:
+            data[k] = tmp[i]
+            i += 1
+            k += 1
+            wins_left += 1
+            wins_right = 0
+            if wins_left >= _MIN_GALLOP:
+                end = bisect_right(tmp, data[j], i, len_left)
+                count = end - i
+                data[k:k + count] = tmp[i:end]
+                k += count
+                i = end
+                wins_left = 0
+
+    # Leftovers of the right run are already in place
+    if i < len_left:
+        data[k:k + len_left - i] = tmp[i:len_left]
+
+
+def _merge_hi(data, lo, mid, hi, tmp):
+    # Right run is the shorter one: copy it out and merge back to front
+    len_right = hi - mid
+    tmp[:len_right] = data[mid:hi]
+    i, j, k = mid - 1, len_right - 1, hi - 1
+    wins_left = wins_right = 0
+
+    while i >= lo and j >= 0:
+        if tmp[j] < data[i]:
+            data[k] = data[i]
+            i -= 1
+            k -= 1
+            wins_left += 1
+            wins_right = 0
+            if wins_left >= _MIN_GALLOP:
+                start = bisect_right(data, tmp[j], lo, i + 1)
+                count = i + 1 - start
+                data[k - count + 1:k + 1] = data[start:i + 1]
+                k -= count
+                i = start - 1
+                wins_left = 0
+        else:
+            data[k] = tmp[j]
+            j -= 1
+            k -= 1
+            wins_right += 1
+            wins_left = 0
+            if wins_right >= _MIN_GALLOP:
+                start = bisect_left(tmp, data[i], 0, j + 1)
+                count = j + 1 - start
+                data[k - count + 1:k + 1] = tmp[start:j + 1]
+                k -= count
+                j = start - 1
+                wins_right = 0
+
+    # Leftovers of the left run are already in place
+    if j >= 0:
+        data[lo:lo + j + 1] = tmp[:j + 1]
+
+
 # -----------------------------------------------------
 # QUICK SORT
 # -----------------------------------------------------
@@ -55,36 +258,205 @@ def quick_sort(arr: List[int]) -> List[int]:
 
 
 # -----------------------------------------------------
-# HEAP SORT
+# INTRO SORT (in-place introspective quicksort)
 # -----------------------------------------------------
-def heap_sort(arr: List[int]) -> List[int]:
+_INSERTION_CUTOFF = 16
+_NINTHER_THRESHOLD = 40
+
+
+def intro_sort(arr: List[int]) -> List[int]:
+    """
+    In-place quicksort variant: median-of-three / ninther pivots,
+    three-way partitioning for duplicates, insertion sort for small
+    slices and a heap sort fallback once the depth limit is reached,
+    so the worst case stays O(n log n). Sorts arr in place and returns it.
+    """
     n = len(arr)
+    if n > 1:
+        _introsort_loop(arr, 0, n, 2 * n.bit_length())
+    return arr
+
+
+def _introsort_loop(arr, lo, hi, depth_limit):
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort_range(arr, lo, hi)
+            return
+        depth_limit -= 1
 
-    # Build max heap
-    for i in range(n//2 - 1, -1, -1):
-        _heapify(arr, n, i)
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition3(arr, lo, hi, pivot)
 
-    # Extract elements
-    for i in range(n-1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        _heapify(arr, i, 0)
+        # Recurse into the smaller side, loop on the larger one,
+        # so the stack never grows beyond O(log n)
+        if lt - lo < hi - gt:
+            _introsort_loop(arr, lo, lt, depth_limit)
+            lo = gt
+        else:
+            _introsort_loop(arr, gt, hi, depth_limit)
+            hi = lt
+
+    _insertion_sort_range(arr, lo, hi)
+
+
+def _median3(arr, a, b, c):
+    # Index of the median of arr[a], arr[b], arr[c]
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def _choose_pivot(arr, lo, hi):
+    last = hi - 1
+    mid = lo + (hi - lo) // 2
+    if hi - lo <= _NINTHER_THRESHOLD:
+        return _median3(arr, lo, mid, last)
+
+    # Tukey's ninther: median of three medians-of-three
+    step = (hi - lo) // 8
+    return _median3(
+        arr,
+        _median3(arr, lo, lo + step, lo + 2 * step),
+        _median3(arr, mid - step, mid, mid + step),
+        _median3(arr, last - 2 * step, last - step, last),
+    )
+
+
+def _partition3(arr, lo, hi, pivot):
+    # Dutch national flag: [lo, lt) < pivot, [lt, gt) == pivot, [gt, hi) > pivot
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = arr[i]
+        if x < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            arr[i] = arr[gt]
+            arr[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort_range(arr, lo, hi):
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
 
+
+# -----------------------------------------------------
+# HEAP SORT
+# -----------------------------------------------------
+def heap_sort(arr: List[int]) -> List[int]:
+    """Heap sort in place with an iterative sift-down (no recursion)."""
+    _heap_sort_range(arr, 0, len(arr))
     return arr
 
-def _heapify(arr, n, i):
-    largest = i
-    l = 2*i + 1
-    r = 2*i + 2
 
-    if l < n and arr[l] > arr[largest]:
-        largest = l
+def _heap_sort_range(arr, lo, hi):
+    # Max-heap over arr[lo:hi], children of slot i live at 2i+1 / 2i+2
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, n)
+
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
 
-    if r < n and arr[r] > arr[largest]:
-        largest = r
 
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        _heapify(arr, n, largest)
+def _sift_down(arr, base, root, end):
+    # Iterative sift-down of heap slot root within arr[base:base+end]
+    item = arr[base + root]
+    child = 2 * root + 1
+    while child < end:
+        right = child + 1
+        if right < end and arr[base + child] < arr[base + right]:
+            child = right
+        if not item < arr[base + child]:
+            break
+        arr[base + root] = arr[base + child]
+        root = child
+        child = 2 * root + 1
+    arr[base + root] = item
+
+
+# -----------------------------------------------------
+# PARTIAL SORT / TOP-K / K-WAY MERGE
+# -----------------------------------------------------
+def top_k(arr: Iterable[int], k: int) -> List[int]:
+    """
+    The k largest items in descending order — O(n log k) time, O(k) memory.
+    arr may be any iterable (e.g. a stream); it is consumed once.
+    """
+    if k <= 0:
+        return []
+
+    it = iter(arr)
+    heap = list(islice(it, k))  # min-heap of the k largest seen so far
+    heapq.heapify(heap)
+    for x in it:
+        if heap[0] < x:
+            heapq.heapreplace(heap, x)
+
+    heap.sort(reverse=True)
+    return heap
+
+
+def nsmallest(arr: Iterable[int], k: int) -> List[int]:
+    """
+    The k smallest items in ascending order — O(n log k) time, O(k) memory.
+    Keeps a bounded max-heap and reuses the heap sort's sift-down.
+    """
+    if k <= 0:
+        return []
+
+    it = iter(arr)
+    heap = list(islice(it, k))
+    size = len(heap)
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(heap, 0, root, size)
+
+    for x in it:
+        if x < heap[0]:
+            heap[0] = x
+            _sift_down(heap, 0, 0, size)
+
+    _heap_sort_range(heap, 0, size)
+    return heap
+
+
+def k_way_merge(iterables: Iterable[Iterable[int]]) -> Iterator[int]:
+    """
+    Lazily merge already-sorted iterables into one sorted stream.
+    Holds one item per input; ties are yielded in input order.
+    """
+    heap = []
+    for index, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for first in it:
+            heap.append((first, index, it))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        value, index, it = heap[0]
+        yield value
+        for nxt in it:
+            heapq.heapreplace(heap, (nxt, index, it))
+            break
+        else:
+            heapq.heappop(heap)
 
 
 # -----------------------------------------------------
@@ -137,15 +509,349 @@ def bubble_sort(arr: List[int]) -> List[int]:
     return arr
 
 
+# -----------------------------------------------------
+# COUNTING SORT / RADIX SORT (integer keys)
+# -----------------------------------------------------
+# Lists, array('q')-style buffers and NumPy integer arrays are accepted and
+# the result has the same container type as the input. When NumPy is
+# installed the work runs on unboxed machine integers (array buffers are
+# viewed without copying); otherwise pure-Python bucket passes are used.
+_RADIX_BITS_SMALL = 8
+_RADIX_BITS_LARGE = 16
+_COUNTING_SPAN_FACTOR = 4
+
+
+def counting_sort(arr: List[int]) -> List[int]:
+    """
+    Counting sort for integer keys — O(n + k) where k = max - min + 1.
+    Falls back to radix sort when k is much larger than n.
+    """
+    if len(arr) == 0:
+        return _like_input(arr, [])
+
+    view = _numpy_int_view(arr)
+    lo, hi = (int(view.min()), int(view.max())) if view is not None else (min(arr), max(arr))
+    if hi - lo + 1 > _COUNTING_SPAN_FACTOR * len(arr) + 1024:
+        return radix_sort(arr)
+
+    if view is not None:
+        # widen before subtracting: small dtypes would wrap (int8: 127 - -128)
+        wide = view.astype(np.uint64 if view.dtype.kind == "u" else np.int64)
+        counts = np.bincount((wide - wide.dtype.type(lo)).astype(np.intp))
+        values = np.arange(lo, lo + counts.size, dtype=view.dtype)
+        return _from_numpy(arr, np.repeat(values, counts))
+
+    counts = [0] * (hi - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+
+    result = []
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend(repeat(lo + offset, count))
+    return _like_input(arr, result)
+
+
+def radix_sort(arr: List[int]) -> List[int]:
+    """
+    LSD radix sort for integer keys — O(d * n) for d digit passes.
+    Negative keys are handled by shifting everything by the minimum.
+    """
+    if len(arr) == 0:
+        return _like_input(arr, [])
+
+    view = _numpy_int_view(arr)
+    if view is not None:
+        # Order-preserving uint64 keys: flipping the sign bit maps int64 onto
+        # uint64 monotonically, so neither 2**63+ unsigned values nor signed
+        # spans wider than 2**63 can overflow. Digits come from key - min.
+        signed = view.dtype.kind == "i"
+        bias = np.uint64(1 << 63)
+        keys = view.astype(np.int64).view(np.uint64) ^ bias if signed else view.astype(np.uint64)
+        base = keys.min()
+        keys = keys - base
+        max_key = int(keys.max())
+        mask = np.uint64((1 << _RADIX_BITS_LARGE) - 1)
+        shift = 0
+        while max_key >> shift:
+            # 16-bit digits: NumPy's stable argsort is itself a radix sort here
+            digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint16)
+            keys = keys[np.argsort(digits, kind="stable")]
+            shift += _RADIX_BITS_LARGE
+        keys = keys + base
+        result = (keys ^ bias).view(np.int64) if signed else keys
+        return _from_numpy(arr, result.astype(view.dtype))
+
+    lo = min(arr)
+    data = [x - lo for x in arr]
+    max_key = max(data)
+    bits = _RADIX_BITS_SMALL if len(data) < (1 << 16) else _RADIX_BITS_LARGE
+    mask = (1 << bits) - 1
+    shift = 0
+    while max_key >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        appenders = [bucket.append for bucket in buckets]
+        for x in data:
+            appenders[(x >> shift) & mask](x)
+        data = list(chain.from_iterable(buckets))
+        shift += bits
+
+    return _like_input(arr, [x + lo for x in data])
+
+
+def _numpy_int_view(arr):
+    # Unboxed view of the input as a NumPy integer array, or None
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr if arr.dtype.kind in "iu" else None
+    if isinstance(arr, array):
+        return np.frombuffer(arr, dtype=arr.typecode) if arr.typecode in "bBhHiIlLqQ" else None
+    view = np.asarray(arr)
+    return view if view.dtype.kind in "iu" else None
+
+
+def _from_numpy(arr, result):
+    if isinstance(arr, np.ndarray):
+        return result
+    if isinstance(arr, array):
+        return array(arr.typecode, result.tobytes())
+    return result.tolist()
+
+
+def _like_input(arr, values):
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.asarray(values, dtype=arr.dtype)
+    if isinstance(arr, array):
+        return array(arr.typecode, values)
+    return list(values)
+
+
+# -----------------------------------------------------
+# EXTERNAL MERGE SORT (memory-mapped input, spilled runs)
+# -----------------------------------------------------
+_DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+
+
+def external_sort(input_path: str, output_path: str,
+                  memory_budget: int = _DEFAULT_MEMORY_BUDGET,
+                  workers: Optional[int] = None, typecode: str = "q",
+                  tmp_dir: Optional[str] = None) -> int:
+    """
+    Sort a binary file of fixed-width integers (array typecode, native
+    byte order) into output_path without loading it into memory.
+
+    The input is memory-mapped and cut into chunks sized so that all
+    in-flight chunks fit in memory_budget bytes; worker processes sort
+    the chunks and spill them as runs to a temporary directory, which are
+    then k-way heap merged into the output file with bounded buffers.
+    Returns the number of items written.
+    """
+    itemsize = array(typecode).itemsize
+    total_bytes = os.path.getsize(input_path)
+    if total_bytes % itemsize:
+        raise ValueError(f"File size is not a multiple of the {itemsize}-byte item size")
+
+    total = total_bytes // itemsize
+    if total == 0:
+        open(output_path, "wb").close()
+        return 0
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    # Each in-flight chunk holds its raw bytes plus the sorted copy
+    chunk_items = max(1, memory_budget // (2 * itemsize * workers))
+
+    run_dir = tempfile.mkdtemp(prefix="algoforge_runs_", dir=tmp_dir)
+    try:
+        tasks = [
+            (input_path, start, min(chunk_items, total - start), typecode,
+             os.path.join(run_dir, f"run_{index:06d}.bin"))
+            for index, start in enumerate(range(0, total, chunk_items))
+        ]
+        if workers == 1 or len(tasks) == 1:
+            run_paths = [_sort_run(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                run_paths = list(pool.map(_sort_run, tasks))
+
+        # One read buffer per run plus one write buffer share the budget
+        block_items = max(1, memory_budget // (itemsize * (len(run_paths) + 1)))
+        runs = [_iter_run(path, typecode, block_items) for path in run_paths]
+
+        with open(output_path, "wb") as out:
+            buffer = array(typecode)
+            for value in k_way_merge(runs):
+                buffer.append(value)
+                if len(buffer) >= block_items:
+                    buffer.tofile(out)
+                    buffer = array(typecode)
+            buffer.tofile(out)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+    return total
+
+
+def _sort_run(task) -> str:
+    # Worker: sort one chunk of the mapped input and spill it to run_path
+    input_path, start, count, typecode, run_path = task
+    itemsize = array(typecode).itemsize
+
+    chunk = array(typecode)
+    with open(input_path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        chunk.frombytes(mapped[start * itemsize:(start + count) * itemsize])
+
+    if np is not None:
+        np.frombuffer(chunk, dtype=typecode).sort()  # in place, no boxing
+    else:
+        chunk = array(typecode, sorted(chunk))
+
+    with open(run_path, "wb") as out:
+        chunk.tofile(out)
+    return run_path
+
+
+def _iter_run(path: str, typecode: str, block_items: int) -> Iterator[int]:
+    # Stream a spilled run back block by block
+    with open(path, "rb") as fh:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(fh, block_items)
+            except EOFError:
+                pass  # short final block; the items read so far are kept
+            if not block:
+                return
+            yield from block
+
+
+# -----------------------------------------------------
+# PARALLEL SAMPLE SORT (process pool + shared memory)
+# -----------------------------------------------------
+_PARALLEL_MIN_SIZE = 1 << 15
+_SAMPLE_OVERSAMPLING = 32
+
+
+def parallel_sample_sort(arr: List[int], workers: Optional[int] = None) -> List[int]:
+    """
+    Parallel sample sort for 64-bit integer keys.
+
+    The input is copied once into a shared-memory buffer; workers sort
+    contiguous blocks of it in place and report where the sampled
+    splitters cut each block, then each worker merges one bucket (the
+    matching segment of every block) straight into a shared output
+    buffer. Only offsets travel through the pool, never the data.
+    Small inputs or workers=1 use a single-process sort.
+    """
+    n = len(arr)
+    workers = max(1, workers or os.cpu_count() or 1)
+    if workers == 1 or n < _PARALLEL_MIN_SIZE:
+        return _like_input(arr, sorted(arr))
+
+    data = array("q", arr)
+    nbytes = n * data.itemsize
+
+    # Splitters: every k-th element of a sorted random sample
+    sample_size = min(n, workers * _SAMPLE_OVERSAMPLING)
+    sample = sorted(data[i] for i in random.sample(range(n), sample_size))
+    splitters = [sample[b * sample_size // workers] for b in range(1, workers)]
+
+    src = shared_memory.SharedMemory(create=True, size=nbytes)
+    dst = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        src.buf[:nbytes] = memoryview(data).cast("B")
+        del data
+
+        step = -(-n // workers)
+        blocks = [(src.name, n, lo, min(lo + step, n), splitters) for lo in range(0, n, step)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            cuts = list(pool.map(_sort_block_and_cut, blocks))
+
+            # Bucket b gathers segment b of every sorted block
+            merges = []
+            offset = 0
+            for bucket in range(workers):
+                segments = [(cut[bucket], cut[bucket + 1]) for cut in cuts]
+                merges.append((src.name, dst.name, n, segments, offset))
+                offset += sum(hi - lo for lo, hi in segments)
+            list(pool.map(_merge_bucket, merges))
+
+        result = array("q")
+        result.frombytes(dst.buf[:nbytes])
+    finally:
+        for segment in (src, dst):
+            segment.close()
+            segment.unlink()
+
+    if isinstance(arr, array) and arr.typecode == result.typecode:
+        return result
+    return _like_input(arr, result)
+
+
+@contextmanager
+def _attached_int_view(name: str, n: int):
+    # int64 view over an existing shared-memory segment, released on exit
+    segment = shared_memory.SharedMemory(name=name)
+    raw = segment.buf[:n * 8]
+    view = raw.cast("q")
+    try:
+        yield view
+    finally:
+        view.release()
+        raw.release()
+        segment.close()
+
+
+def _sort_block_and_cut(task) -> List[int]:
+    # Worker: sort src[lo:hi] in place, return the bucket boundaries inside it
+    name, n, lo, hi, splitters = task
+    with _attached_int_view(name, n) as view:
+        block = sorted(view[lo:hi])
+        view[lo:hi] = array("q", block)
+    return [lo] + [lo + bisect_right(block, s) for s in splitters] + [hi]
+
+
+def _merge_bucket(task) -> None:
+    # Worker: merge one segment of every block into dst at the bucket offset
+    src_name, dst_name, n, segments, offset = task
+    with _attached_int_view(src_name, n) as src, _attached_int_view(dst_name, n) as dst:
+        merged = array("q", k_way_merge(src[lo:hi] for lo, hi in segments))
+        dst[offset:offset + len(merged)] = merged
+
+
+def benchmark_parallel_sample_sort(n: int = 1_000_000,
+                                   worker_counts: Sequence[int] = (1, 2, 4)) -> List[Dict[str, float]]:
+    """Time parallel_sample_sort on n random ints for each worker count."""
+    data = [random.randint(0, 100000) for _ in range(n)]
+    rows = []
+    baseline = None
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        parallel_sample_sort(data, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        rows.append({"workers": workers, "time": elapsed, "speedup": baseline / elapsed})
+
+    return rows
+
+
 # -----------------------------------------------------
 # PROVIDE ALL SORTING ALGORITHMS TO BENCHMARK ENGINE
 # -----------------------------------------------------
 def get_sorting_algorithms():
     return {
         "merge_sort": merge_sort,
+        "adaptive_merge_sort": adaptive_merge_sort,
         "quick_sort": quick_sort,
+        "intro_sort": intro_sort,
         "heap_sort": heap_sort,
         "insertion_sort": insertion_sort,
         "selection_sort": selection_sort,
         "bubble_sort": bubble_sort,
+        "counting_sort": counting_sort,
+        "radix_sort": radix_sort,
+        "parallel_sample_sort": parallel_sample_sort,
     }
\ No newline at end of file